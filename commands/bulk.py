@@ -1,12 +1,81 @@
+import json
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from commands.common import print_help_for_command
 from commands.load import cmd_load
-from commands.check import cmd_check
-from utils.core import debug_print
+from commands.check import _fetch_page_data, _report_fetch_errors
+from utils.cache import (
+    _cache_page_data,
+    _find_reusable_page_data_for_url,
+    _is_cache_valid_for_context,
+)
+from utils.core import debug_print, is_debug_enabled
 
 
 from pathlib import Path
 
+# Buffer size for reading/writing the bulk progress workbook
+_BULK_IO_BUFFER = 1 << 20
+
+# Upper bound on concurrent page fetches during a bulk check
+_BULK_FETCH_WORKERS = 10
+
+# Last parsed progress workbook, keyed by (path, mtime_ns, size)
+_BULK_WORKBOOK_CACHE = {}
+
+# Link schemes that don't need migrating by hand
+_EASY_LINK_PREFIXES = ("tel:", "mailto:")
+
+# Columns filled in by a bulk check run
+_BULK_RESULT_COLUMNS = (
+    "existing_url",
+    "no_links",
+    "no_pdfs",
+    "no_embeds",
+    "% difficulty",
+)
+
+# Result columns that must all be filled for a row to count as done
+_BULK_COUNT_COLUMNS = ("no_links", "no_pdfs", "no_embeds", "% difficulty")
+
+# Header row followed by the comment/example rows written to a new template
+_BULK_TEMPLATE_ROWS = (
+    (
+        "kanban_id",
+        "title",
+        "domain",
+        "row",
+        "existing_url",
+        "no_links",
+        "no_pdfs",
+        "no_embeds",
+        "% difficulty",
+    ),
+    (
+        "# Kanban card ID",
+        "# Page title here",
+        "# Fill in domain and row, leave other columns empty",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    (
+        "# Example: abc123def456",
+        "# Example: Department of Surgery",
+        "# Example: medicine.musc.edu",
+        42,
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+)
+
 
 def _calculate_difficulty_percentage(links_data):
     """Calculate the difficulty percentage based on easy links (tel: and mailto:).
@@ -20,96 +89,117 @@ def _calculate_difficulty_percentage(links_data):
         return 0.0
 
     total_links = len(links_data)
-    if total_links == 0:
-        return 0.0
 
-    easy_links = 0
-    for link in links_data:
-        # link is a tuple of (text, href, status)
-        href = link[1] if len(link) > 1 else ""
-        if href.startswith(("tel:", "mailto:")):
-            easy_links += 1
+    # link is a tuple of (text, href, status)
+    easy_links = sum(
+        1
+        for link in links_data
+        if len(link) > 1 and link[1].startswith(_EASY_LINK_PREFIXES)
+    )
 
     # Calculate difficulty as (total - easy) / total
-    difficulty = (total_links - easy_links) / total_links
-    return difficulty
+    return (total_links - easy_links) / total_links
 
 
 def _create_bulk_check_template(xlsx_path):
     """Create a template Excel file for bulk checking."""
-    data = {
-        "kanban_id": ["# Kanban card ID", "# Example: abc123def456"],
-        "title": ["# Page title here", "# Example: Department of Surgery"],
-        "domain": [
-            "# Fill in domain and row, leave other columns empty",
-            "# Example: medicine.musc.edu",
-        ],
-        "row": ["", 42],
-        "existing_url": ["", ""],
-        "no_links": ["", ""],
-        "no_pdfs": ["", ""],
-        "no_embeds": ["", ""],
-        "% difficulty": ["", ""],
-    }
+    df = pd.DataFrame.from_records(
+        _BULK_TEMPLATE_ROWS[1:], columns=_BULK_TEMPLATE_ROWS[0]
+    )
+    with open(xlsx_path, "wb", buffering=_BULK_IO_BUFFER) as f:
+        df.to_excel(f, index=False, engine="openpyxl")
 
-    df = pd.DataFrame(data)
-    df.to_excel(xlsx_path, index=False, engine="openpyxl")
 
+def _bulk_workbook_key(xlsx_path):
+    stat = Path(xlsx_path).stat()
+    return str(Path(xlsx_path).resolve()), stat.st_mtime_ns, stat.st_size
 
-def _load_bulk_check_xlsx(xlsx_path):
-    """Load Excel file and return rows that need processing."""
-    rows_to_process = []
 
-    # Read the Excel file
-    df = pd.read_excel(xlsx_path, engine="openpyxl")
+def _read_bulk_workbook(xlsx_path):
+    """Read the progress workbook, reusing the last read if the file is unchanged.
 
-    for index, row in df.iterrows():
-        # Skip comment rows and empty rows
-        debug_print(f"Processing row: {row.to_dict()}")
-        domain_val = str(row.get("domain", "")).strip()
-        debug_print(f"Row domain: {domain_val}")
+    A bulk run reads the workbook to find pending rows and again to fold the
+    results in; the second read is served from memory. A copy is returned so
+    callers can modify it freely.
+    """
+    key = _bulk_workbook_key(xlsx_path)
+    cached = _BULK_WORKBOOK_CACHE.get(key)
+    if cached is not None:
+        debug_print(f"Reusing parsed workbook for {xlsx_path}")
+        return cached.copy()
 
-        if domain_val.startswith("#") or not domain_val:
-            continue
+    with open(xlsx_path, "rb", buffering=_BULK_IO_BUFFER) as f:
+        df = pd.read_excel(f, engine="openpyxl")
+    _BULK_WORKBOOK_CACHE.clear()
+    _BULK_WORKBOOK_CACHE[key] = df.copy()
+    return df
 
-        # Skip rows that already have data (all count fields are filled)
-        if (
-            pd.notna(row.get("no_links", ""))
-            and str(row.get("no_links", "")).strip()
-            and pd.notna(row.get("no_pdfs", ""))
-            and str(row.get("no_pdfs", "")).strip()
-            and pd.notna(row.get("no_embeds", ""))
-            and str(row.get("no_embeds", "")).strip()
-            and pd.notna(row.get("% difficulty", ""))
-            and str(row.get("% difficulty", "")).strip()
-        ):
-            continue
 
-        # Validate required fields
-        row_val = row.get("row", "")
-        if not domain_val or pd.isna(row_val) or str(row_val).strip() == "":
-            continue
+def _write_bulk_workbook(xlsx_path, df):
+    """Write the progress workbook and drop the cached read."""
+    _BULK_WORKBOOK_CACHE.clear()
+    with open(xlsx_path, "wb", buffering=_BULK_IO_BUFFER) as f:
+        df.to_excel(f, index=False, engine="openpyxl")
 
-        try:
-            row_num = int(
-                float(str(row_val))
-            )  # Handle potential float values from Excel
-            rows_to_process.append(
-                {
-                    "kanban_id": str(row.get("kanban_id", "")).lstrip("'").strip(),
-                    "title": str(row.get("title", "")).strip(),
-                    "domain": domain_val,
-                    "row": row_num,
-                }
-            )
-        except (ValueError, TypeError):
-            continue
 
-    return rows_to_process
+def _bulk_text_column(df, name):
+    """Return column ``name`` as stripped strings, with blanks for missing cells."""
+    if name not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    col = df[name]
+    return col.where(col.notna(), "").astype(str).str.strip()
+
 
+def _load_bulk_check_xlsx(xlsx_path):
+    """Load Excel file and return rows that need processing."""
+    # Read the Excel file
+    df = _read_bulk_workbook(xlsx_path)
+
+    domains = _bulk_text_column(df, "domain")
+    if is_debug_enabled():
+        for row, domain_val in zip(df.itertuples(index=False, name=None), domains):
+            debug_print(f"Processing row: {row}")
+            debug_print(f"Row domain: {domain_val}")
+
+    # Skip comment rows, empty rows and rows that already have data (all
+    # count fields are filled)
+    filled = pd.Series(True, index=df.index)
+    for name in _BULK_COUNT_COLUMNS:
+        filled &= _bulk_text_column(df, name).ne("")
+    mask = domains.ne("") & ~domains.str.startswith("#") & ~filled
+
+    # Validate required fields; Excel may hand back row numbers as floats
+    row_nums = pd.to_numeric(_bulk_text_column(df, "row")[mask], errors="coerce")
+    row_nums = row_nums[np.isfinite(row_nums)]
+    keep = row_nums.index
+
+    kanban_ids = _bulk_text_column(df, "kanban_id")[keep].str.lstrip("'").str.strip()
+    titles = _bulk_text_column(df, "title")[keep]
+
+    return [
+        {"kanban_id": kanban_id, "title": title, "domain": domain, "row": int(row_num)}
+        for kanban_id, title, domain, row_num in zip(
+            kanban_ids, titles, domains[keep], row_nums
+        )
+    ]
 
-def _update_bulk_check_xlsx(
-    xlsx_path,
+
+def _bulk_log_path(xlsx_path):
+    """Return the append-only log that holds results not yet written to Excel."""
+    xlsx_path = Path(xlsx_path)
+    return xlsx_path.with_name(f"{xlsx_path.name}.updates.log")
+
+
+def _bulk_row_key(domain_name, row_num):
+    """Build the update key for a domain/row pair."""
+    row_str = str(row_num).strip()
+    if row_str.endswith(".0"):
+        row_str = row_str[:-2]  # Excel hands back integer rows as floats
+    return f"{str(domain_name).strip().lower()}|{row_str}"
+
+
+def _append_bulk_update(
+    log_file,
     domain_name,
     row_num,
     url,
@@ -118,69 +208,89 @@ def _update_bulk_check_xlsx(
     embeds_count,
     difficulty_pct,
 ):
-    """Update the Excel file with the results for a specific row."""
-    try:
-        # Read the Excel file
-        df = pd.read_excel(xlsx_path, engine="openpyxl")
-
-        # Ensure required columns exist
-        required_columns = [
-            "existing_url",
-            "no_links",
-            "no_pdfs",
-            "no_embeds",
-            "% difficulty",
-        ]
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ""  # Add missing column with empty values
-
-        # Find and update the matching row
-        row_found = False
-        for index, row in df.iterrows():
-            domain_val = str(row.get("domain", "")).strip()
-            row_val = row.get("row", "")
-
-            # DEBUG: Print the actual types to help diagnose
-            debug_print(
-                f"Row value type: {type(row_val)}, Domain value type: {type(domain_val)}"
-            )
+    """Append the results for a specific row to the open update log.
 
-            # Convert both to strings and strip, then normalize numeric values by removing decimal point
-            row_val_str = str(row_val).strip()
-            if row_val_str.endswith(".0"):
-                row_val_str = row_val_str[:-2]  # Remove the ".0" suffix
+    The line is flushed straight away so an interrupted run keeps every
+    result recorded so far.
+    """
+    entry = {
+        "key": _bulk_row_key(domain_name, row_num),
+        "values": {
+            "existing_url": url,
+            "no_links": links_count,
+            "no_pdfs": pdfs_count,
+            "no_embeds": embeds_count,
+            "% difficulty": difficulty_pct,
+        },
+    }
+    log_file.write(json.dumps(entry) + "\n")
+    log_file.flush()
 
-            row_num_str = str(row_num).strip()
 
-            # Debug the values to help troubleshooting
-            debug_print(
-                f"Comparing: '{domain_val}' == '{domain_name}' and '{row_val_str}' == '{row_num_str}'"
-            )
+def _read_bulk_log(xlsx_path):
+    """Read pending results from the update log, last write per row wins."""
+    log_path = _bulk_log_path(xlsx_path)
+    updates = {}
+    if not log_path.exists():
+        return updates
+    try:
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    updates[entry["key"]] = entry["values"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # A run killed mid-write can leave a truncated last line
+                    debug_print(f"Skipping malformed bulk log line: {line!r}")
+    except OSError as e:
+        debug_print(f"Error reading bulk log {log_path}: {e}")
+    return updates
+
+
+def _compact_bulk_check_xlsx(xlsx_path):
+    """Write logged results into the Excel file in a single pass.
+
+    Returns the update keys that did not match any row. The log is removed
+    once the workbook has been written.
+    """
+    updates = _read_bulk_log(xlsx_path)
+    if not updates:
+        _bulk_log_path(xlsx_path).unlink(missing_ok=True)
+        return []
 
-            if domain_val.lower() == domain_name.lower() and row_val_str == row_num_str:
-                debug_print(f"Match found at index {index}")
-                df.at[index, "existing_url"] = url
-                df.at[index, "no_links"] = links_count
-                df.at[index, "no_pdfs"] = pdfs_count
-                df.at[index, "no_embeds"] = embeds_count
-                df.at[index, "% difficulty"] = difficulty_pct
-                row_found = True
-                break
-
-        if not row_found:
-            debug_print(
-                f"Warning: No matching row found for {domain_name} row {row_num}"
-            )
-            return False
+    # Read the Excel file
+    df = _read_bulk_workbook(xlsx_path)
+
+    # Ensure required columns exist
+    for col in _BULK_RESULT_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""  # Add missing column with empty values
+        df[col] = df[col].astype(object)
+
+    # Index the sheet by domain/row once instead of scanning per result
+    row_index = {
+        _bulk_row_key(domain_val, row_val): index
+        for index, domain_val, row_val in zip(
+            df.index, df.get("domain", ()), df.get("row", ())
+        )
+        if pd.notna(domain_val) and pd.notna(row_val)
+    }
+
+    unmatched = []
+    for key, values in updates.items():
+        index = row_index.get(key)
+        if index is None:
+            debug_print(f"Warning: No matching row found for {key}")
+            unmatched.append(key)
+            continue
+        for col, value in values.items():
+            df.at[index, col] = value
 
-        # Write back to Excel file
-        df.to_excel(xlsx_path, index=False, engine="openpyxl")
-        return True
+    # Write back to Excel file
+    _write_bulk_workbook(xlsx_path, df)
 
-    except Exception as e:
-        debug_print(f"Error updating Excel file {xlsx_path}: {e}")
-        return False
+    _bulk_log_path(xlsx_path).unlink(missing_ok=True)
+    return unmatched
 
 
 def cmd_bulk_check(args, state):
@@ -209,6 +319,10 @@ def cmd_bulk_check(args, state):
 
     # Load Excel file and process unscanned rows
     try:
+        # Fold in results logged by an interrupted run first
+        for key in _compact_bulk_check_xlsx(xlsx_path):
+            print(f"  ⚠️ Discarding logged result with no matching row: {key}")
+
         rows_to_process = _load_bulk_check_xlsx(xlsx_path)
         if not rows_to_process:
             print("✅ All rows in the Excel file have already been processed!")
@@ -229,76 +343,155 @@ def cmd_bulk_check(args, state):
         #     print(f"📊 Loaded DSM file: {dsm_file}")
 
         # Process each row
-        processed_count = 0
-        for i, row_data in enumerate(rows_to_process, 1):
-            domain_name = row_data["domain"]
-            row_num = row_data["row"]
-            kanban_id = row_data.get("kanban_id", "")
+        try:
+            with open(_bulk_log_path(xlsx_path), "a", encoding="utf-8") as log_file:
+                processed_count = _process_bulk_rows(rows_to_process, state, log_file)
+        finally:
+            unmatched = _compact_bulk_check_xlsx(xlsx_path)
+        for key in unmatched:
+            print(f"  ⚠️ Failed to update Excel file for {key}")
+        processed_count -= len(unmatched)
+        print(
+            f"\n✅ Bulk check complete! Processed {processed_count}/{len(rows_to_process)} rows"
+        )
+        print(f"📋 Results saved to: {xlsx_filename}")
 
-            print(
-                f"\n🔄 Processing {i}/{len(rows_to_process)}: {domain_name} row {row_num}, kanban_id: {kanban_id}"
+    except Exception as e:
+        print(f"❌ Error processing Excel file: {e}")
+        debug_print(f"Full error: {e}")
+
+
+def _record_bulk_row(state, log_file, row_data, page_data):
+    """Count the items in ``page_data`` and append them to ``log_file``."""
+    # Count items (excluding sidebar)
+    links = page_data.get("links", [])
+    links_count = len(links)
+    pdfs_count = len(page_data.get("pdfs", []))
+    embeds_count = len(page_data.get("embeds", []))
+
+    # Calculate difficulty percentage
+    difficulty_pct = _calculate_difficulty_percentage(links)
+
+    print(
+        f"  📊 {row_data['domain']} row {row_data['row']}: {links_count} links, {pdfs_count} PDFs, {embeds_count} embeds, {difficulty_pct:.1%} difficulty",
+    )
+
+    _append_bulk_update(
+        log_file,
+        row_data["domain"],
+        row_data["row"],
+        state.get_variable("URL"),
+        links_count,
+        pdfs_count,
+        embeds_count,
+        difficulty_pct,
+    )
+
+
+def _process_bulk_rows(rows_to_process, state, log_file):
+    """Check each row and append its results to ``log_file``.
+
+    Rows are loaded one at a time on the calling thread. Rows with valid
+    cached page data are recorded straight away; the rest are fetched in a
+    thread pool and cached and recorded on the calling thread as each fetch
+    completes, so each row's messages are printed together from the calling
+    thread. Returns the number of rows that produced results.
+    """
+    processed_count = 0
+    pending = {}
+    with ThreadPoolExecutor(max_workers=_BULK_FETCH_WORKERS) as executor:
+        for i, row_data in enumerate(rows_to_process, 1):
+            recorded, future = _start_bulk_row(
+                i, len(rows_to_process), row_data, state, log_file, executor
             )
+            if recorded:
+                processed_count += 1
+            elif future is not None:
+                pending[future] = (row_data, dict(state.variables))
 
-            try:
-                # Use existing cmd_load to populate state variables
-                cmd_load([domain_name, str(row_num)], state)
-                url = state.get_variable("URL")
-                if not url:
-                    print(f"❌ Failed to load URL for {domain_name} row {row_num}")
-                    continue
-
-                # Set kanban_id in state for caching
-                state.set_variable("KANBAN_ID", kanban_id)
-
-                # Ensure selector and sidebar settings
-                if not state.get_variable("SELECTOR"):
-                    state.set_variable("SELECTOR", "#main")
-                state.set_variable("INCLUDE_SIDEBAR", False)
-
-                # Reuse existing check logic
-                cmd_check([], state)
-                page_data = state.current_page_data or {}
-
-                # Count items (excluding sidebar)
-                links_count = len(page_data.get("links", []))
-                pdfs_count = len(page_data.get("pdfs", []))
-                embeds_count = len(page_data.get("embeds", []))
-
-                # Calculate difficulty percentage
-                difficulty_pct = _calculate_difficulty_percentage(
-                    page_data.get("links", [])
-                )
+        if pending:
+            print(f"\n🔄 Waiting for {len(pending)} page checks...")
 
+        for future in as_completed(pending):
+            row_data, variables = pending[future]
+            try:
+                page_data, errors = future.result()
+                _report_fetch_errors(errors)
+                state.variables.update(variables)
+                state.current_page_data = page_data
+                urls = state.get_variable("EXISTING_URLS") or [
+                    state.get_variable("URL")
+                ]
+                _cache_page_data(state, urls[0], page_data, compact=True)
+                _record_bulk_row(state, log_file, row_data, page_data)
+                processed_count += 1
+            except Exception as e:
                 print(
-                    f"  📊 Found: {links_count} links, {pdfs_count} PDFs, {embeds_count} embeds, {difficulty_pct:.1%} difficulty",
+                    f"❌ Error processing {row_data['domain']} row {row_data['row']}: {e}"
                 )
+                debug_print(f"Full error: {e}")
 
-                update_success = _update_bulk_check_xlsx(
-                    xlsx_path,
-                    domain_name,
-                    row_num,
-                    url,
-                    links_count,
-                    pdfs_count,
-                    embeds_count,
-                    difficulty_pct,
-                )
-                if update_success:
-                    processed_count += 1
-                else:
-                    print(
-                        f"  ⚠️ Failed to update Excel file for {domain_name} row {row_num}"
-                    )
+    return processed_count
 
-            except Exception as e:
-                print(f"❌ Error processing {domain_name} row {row_num}: {e}")
-                debug_print(f"Full error: {e}")
-                continue
-        print(
-            f"\n✅ Bulk check complete! Processed {processed_count}/{len(rows_to_process)} rows"
+
+def _start_bulk_row(i, total, row_data, state, log_file, executor):
+    """Load a row and either record it from cache or submit its page fetch.
+
+    Returns ``(recorded, future)``: ``recorded`` is True when the row was
+    recorded from cached data, and ``future`` is the submitted page fetch,
+    if any.
+    """
+    domain_name = row_data["domain"]
+    row_num = row_data["row"]
+    kanban_id = row_data.get("kanban_id", "")
+
+    print(
+        f"\n🔄 Processing {i}/{total}: {domain_name} row {row_num}, kanban_id: {kanban_id}"
+    )
+
+    try:
+        # Use existing cmd_load to populate state variables
+        cmd_load([domain_name, str(row_num)], state)
+        url = state.get_variable("URL")
+        if not url:
+            print(f"❌ Failed to load URL for {domain_name} row {row_num}")
+            return False, None
+
+        # Set kanban_id in state for caching
+        state.set_variable("KANBAN_ID", kanban_id)
+
+        # Ensure selector and sidebar settings
+        if not state.get_variable("SELECTOR"):
+            state.set_variable("SELECTOR", "#main")
+        state.set_variable("INCLUDE_SIDEBAR", False)
+
+        urls = state.get_variable("EXISTING_URLS") or [url]
+        if len(urls) == 1:
+            if state.current_page_data:
+                is_valid, reason = _is_cache_valid_for_context(
+                    state, state.get_variable("CACHE_FILE")
+                )
+                if is_valid:
+                    print("  📋 Using cached data")
+                    _record_bulk_row(state, log_file, row_data, state.current_page_data)
+                    return True, None
+                debug_print(f"Cache validation failed: {reason}")
+
+            # The same page may already have been fetched for another row
+            page_data = _find_reusable_page_data_for_url(state)
+            if page_data is not None:
+                print("  📋 Reusing cached data fetched for another row")
+                state.current_page_data = page_data
+                _cache_page_data(state, url, page_data, compact=True)
+                _record_bulk_row(state, log_file, row_data, page_data)
+                return True, None
+
+        future = executor.submit(
+            _fetch_page_data, urls, state.get_variable("SELECTOR"), False
         )
-        print(f"📋 Results saved to: {xlsx_filename}")
+        return False, future
 
     except Exception as e:
-        print(f"❌ Error processing Excel file: {e}")
+        print(f"❌ Error processing {domain_name} row {row_num}: {e}")
         debug_print(f"Full error: {e}")
+        return False, None
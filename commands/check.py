@@ -52,6 +52,30 @@ def _merge_page_data(base, new):
     return base
 
 
+def _fetch_page_data(urls, selector, include_sidebar):
+    """Retrieve and merge page data for ``urls`` without touching CLI state.
+
+    URLs that fail to extract are skipped. Returns ``(combined, errors)``,
+    where ``errors`` lists ``(url, error)`` for each skipped URL; nothing is
+    printed, so callers on other threads leave reporting to the caller.
+    """
+    combined = {}
+    errors = []
+    for u in urls:
+        data = retrieve_page_data(u, selector, include_sidebar)
+        if "error" in data:
+            errors.append((u, data["error"]))
+            continue
+        combined = _merge_page_data(combined, data)
+    return combined, errors
+
+
+def _report_fetch_errors(errors):
+    """Print the failures returned by :func:`_fetch_page_data`."""
+    for url, error in errors:
+        print(f"❌ Failed to extract data for {url}: {error}")
+
+
 def cmd_check(args, state):
     # TODO add ability to run check with args like --url, --selector, --include-sidebar
     urls = state.get_variable("EXISTING_URLS") or []
@@ -97,14 +121,8 @@ def cmd_check(args, state):
     spinner = Spinner(f"🔄 Please wait...")
     spinner.start()
 
-    combined = {}
     try:
-        for u in urls:
-            data = retrieve_page_data(u, selector, include_sidebar)
-            if "error" in data:
-                print(f"❌ Failed to extract data for {u}: {data['error']}")
-                continue
-            combined = _merge_page_data(combined, data)
+        combined, errors = _fetch_page_data(urls, selector, include_sidebar)
     except Exception as e:
         print(f"❌ Error during page check: {e}")
         debug_print(f"Full error: {e}")
@@ -112,6 +130,7 @@ def cmd_check(args, state):
     finally:
         spinner.stop()
 
+    _report_fetch_errors(errors)
     state.current_page_data = combined
 
     if urls:
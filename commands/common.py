@@ -1,4 +1,4 @@
-from constants import DOMAINS
+from constants import DOMAIN_NAMES
 from utils.core import sync_debug_with_state
 
 
@@ -45,6 +45,10 @@ def print_help_for_command(command, state):
             print("  4. Update the CSV with link counts and difficulty percentage")
             print("  5. Cache the page data for faster report generation")
             print()
+            print(
+                "Results are appended to <file>.updates.log during the run and written to the workbook once at the end."
+            )
+            print()
             print(
                 "% difficulty represents the percentage of non-easy links (tel: and mailto: are easy)"
             )
@@ -68,7 +72,7 @@ def print_help_for_command(command, state):
             print("Usage: load <domain> <row_number>")
             if state.excel_data:
                 print("Available domains:")
-                for i, domain in enumerate([d.get("full_name") for d in DOMAINS], 1):
+                for i, domain in enumerate(DOMAIN_NAMES, 1):
                     print(f"  {i:2}. {domain}")
             return
         case "open":
@@ -127,7 +131,7 @@ def print_help_for_command(command, state):
 
 def display_domains():
     """Print the list of available domains."""
-    for i, domain in enumerate([domain.get("full_name") for domain in DOMAINS], 1):
+    for i, domain in enumerate(DOMAIN_NAMES, 1):
         print(f"  {i:2}. {domain}")
 
 
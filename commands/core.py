@@ -22,6 +22,21 @@ from utils.cache import (
     _update_state_from_cache,
 )
 
+# Characters replaced with "_" when building report filenames from a domain
+_DOMAIN_CLEAN_RE = re.compile(r"[^a-zA-Z0-9]")
+_DOMAIN_CLEAN_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(128) if not chr(c).isalnum()}
+)
+
+
+def _clean_domain_name(domain):
+    """Lower-case ``domain`` and replace anything but ASCII letters/digits with "_"."""
+    domain = domain.lower()
+    if domain.isascii():
+        return domain.translate(_DOMAIN_CLEAN_TABLE)
+    # The table only covers ASCII; fall back to the regex for anything else
+    return _DOMAIN_CLEAN_RE.sub("_", domain)
+
 
 def cmd_links(args, state):
     """Analyze all links on the current page for migration requirements."""
@@ -30,29 +45,56 @@ def cmd_links(args, state):
     output_internal_links_analysis_detail(state)
 
 
+# Resolve the platform once; it can't change while the CLI is running
+_SYSTEM = platform.system()
+
+# Commands that open a file path or URL with the platform's default handler
+_OPENERS = {
+    "Darwin": lambda target: subprocess.run(["open", target], check=True),
+    "Windows": lambda target: subprocess.run(
+        ["start", "", target], shell=True, check=True
+    ),
+    "Linux": lambda target: subprocess.run(["xdg-open", target], check=True),
+}
+
+
+def _open_with_default_handler(target):
+    try:
+        opener = _OPENERS[_SYSTEM]
+    except KeyError:
+        raise OSError(f"Unsupported operating system: {_SYSTEM}") from None
+    opener(target)
+
+
 def _open_file_in_default_app(file_path):
-    system = platform.system()
-    file_path = Path(file_path).resolve()
-    if system == "Darwin":
-        subprocess.run(["open", str(file_path)], check=True)
-    elif system == "Windows":
-        subprocess.run(["start", "", str(file_path)], shell=True, check=True)
-    elif system == "Linux":
-        subprocess.run(["xdg-open", str(file_path)], check=True)
-    else:
-        raise OSError(f"Unsupported operating system: {system}")
+    _open_with_default_handler(str(Path(file_path).resolve()))
+
+
+def _open_files_in_default_app(file_paths):
+    """Open several files, returning ``(path, error)`` for any that failed.
+
+    macOS ``open`` accepts many paths, so they are opened in one call there;
+    other platforms open each file in turn.
+    """
+    if _SYSTEM == "Darwin":
+        paths = [str(Path(p).resolve()) for p in file_paths]
+        try:
+            subprocess.run(["open", *paths], check=True)
+        except Exception as e:
+            return [(path, e) for path in file_paths]
+        return []
+
+    failures = []
+    for file_path in file_paths:
+        try:
+            _open_file_in_default_app(file_path)
+        except Exception as e:
+            failures.append((file_path, e))
+    return failures
 
 
 def _open_url_in_browser(url):
-    system = platform.system()
-    if system == "Darwin":
-        subprocess.run(["open", url], check=True)
-    elif system == "Windows":
-        subprocess.run(["start", "", url], shell=True, check=True)
-    elif system == "Linux":
-        subprocess.run(["xdg-open", url], check=True)
-    else:
-        raise OSError(f"Unsupported operating system: {system}")
+    _open_with_default_handler(url)
 
 
 def cmd_open(args, state):
@@ -104,7 +146,7 @@ def cmd_open(args, state):
             return
 
         # Generate the expected report filename
-        clean_domain = re.sub(r"[^a-zA-Z0-9]", "_", domain.lower())
+        clean_domain = _clean_domain_name(domain)
         report_file = Path(f"./reports/{clean_domain}_{row}.html")
 
         if not report_file.exists():
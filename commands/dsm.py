@@ -2,10 +2,9 @@
 Command to display DSM row data in tabular format.
 """
 
-import pandas as pd
-from constants import DOMAINS
+from constants import DOMAINS_BY_NAME
 from utils.core import debug_print
-from data.dsm import get_column_value
+from commands.load import _resolve_domain_and_row
 
 
 def cmd_dsm(args, state):
@@ -28,23 +27,18 @@ def cmd_dsm(args, state):
         return
 
     # Find the domain configuration
-    domain = next((d for d in DOMAINS if d.get("full_name") == domain_name), None)
+    domain = DOMAINS_BY_NAME.get(domain_name.lower())
 
     if not domain:
         print(f"❌ Domain '{domain_name}' not found in configuration.")
         return
 
+    import pandas as pd
+
     try:
-        # Parse the worksheet
-        df = state.excel_data.parse(
-            sheet_name=domain.get("worksheet_name"),
-            header=domain.get("worksheet_header_row", 4),
-        )
-
-        # Calculate the dataframe row index
-        df_header_row = domain.get("worksheet_header_row", 4) + 2
+        # Parse the worksheet and calculate the dataframe row index
         row_num = int(row)
-        df_idx = row_num - df_header_row
+        df, df_idx = _resolve_domain_and_row(state, domain, row_num)
 
         if df_idx < 0 or df_idx >= len(df):
             print(f"❌ Row {row_num} is out of range for domain '{domain_name}'.")
@@ -68,14 +62,12 @@ def cmd_dsm(args, state):
         print(f"DSM ROW DATA: {domain_name} - Row {row}")
         print("=" * 80)
 
-        # Display as a table using pandas
+        # Display as a two-column table, padding the column names
         if display_data:
-            display_df = pd.DataFrame(display_data)
-            # Set pandas display options to show full content without truncation
-            pd.set_option("display.max_colwidth", None)
-            pd.set_option("display.width", None)
-            pd.set_option("display.max_rows", None)
-            print(display_df.to_string(index=False))
+            width = max(len("Column"), *(len(d["Column"]) for d in display_data))
+            print(f"{'Column'.ljust(width)}  Value")
+            for d in display_data:
+                print(f"{d['Column'].ljust(width)}  {d['Value']}")
         else:
             print("No data found for this row.")
 
@@ -5,52 +5,75 @@ from data.dsm import (
     get_proposed_url,
     get_column_value,
 )
-from constants import DOMAINS
+from constants import DOMAINS, dsm_row_offset
 from utils.core import debug_print
 from utils.cache import _update_state_from_cache
 from utils.validation import validation_wrapper
 
 
-def _extract_url_and_proposed_path(state, domain, row_num):
-    """Load URLs and proposed path for a domain/row and update state.
+def _resolve_domain_and_row(state, domain, row_num):
+    """Return the parsed worksheet for ``domain`` and the dataframe index of a row.
 
     Parameters
     ----------
     state : object
-        Current CLI state object containing the loaded spreadsheet and variables.
+        Current CLI state object containing the loaded spreadsheet.
     domain : dict
         Domain configuration dictionary from :data:`DOMAINS`.
     row_num : int
-        Row number in the spreadsheet to load.
+        Spreadsheet row number as shown in Excel.
 
     Returns
     -------
-    tuple[list[str] | None, str | None]
-        ``(urls, proposed_path)`` if URLs were found, otherwise ``(None, None)``.
+    tuple[pandas.DataFrame, int]
+        ``(df, df_idx)``; ``df_idx`` may fall outside the dataframe.
     """
+    df = state.excel_data.parse(
+        sheet_name=domain.get("worksheet_name"),
+        header=domain.get("worksheet_header_row", 4),
+    )
+    return df, row_num - dsm_row_offset(domain)
 
-    if not state.excel_data:
-        dsm_file = get_latest_dsm_file()
-        if not dsm_file:
-            raise RuntimeError(
-                "No DSM file found. Set DSM_FILE manually or place a dsm-*.xlsx file in the directory."
-            )
-        state.excel_data = load_spreadsheet(dsm_file)
-        state.set_variable("DSM_FILE", dsm_file)
 
-    df_header_row = domain.get("worksheet_header_row", 4) + 2
+def _read_dsm_row(state, domain, row_num):
+    """Read the URL, proposed path, taxonomy and template for a DSM row.
+
+    Results are memoised on ``state`` per worksheet and row, and dropped
+    whenever a different workbook is loaded into ``state.excel_data``.
+
+    Parameters
+    ----------
+    state : object
+        Current CLI state object containing the loaded spreadsheet.
+    domain : dict
+        Domain configuration dictionary from :data:`DOMAINS`.
+    row_num : int
+        Row number in the spreadsheet to read.
+
+    Returns
+    -------
+    tuple[list[str], str | None, str, str]
+        ``(urls, proposed, taxonomy, template)`` for the row.
+    """
+    source, rows = getattr(state, "_dsm_row_cache", None) or (None, None)
+    if source is not state.excel_data:
+        rows = {}
+        state._dsm_row_cache = (state.excel_data, rows)
+
+    key = (domain.get("worksheet_name"), row_num)
+    cached = rows.get(key)
+    if cached is not None:
+        debug_print(f"Reusing DSM values for {key[0]} row {row_num}")
+        urls, proposed, taxonomy, template = cached
+        return list(urls), proposed, taxonomy, template
+
     existing_url_header = domain.get("existing_url_col_name", "EXISTING URL")
     proposed_url_header = domain.get("proposed_url_col_name", "PROPOSED URL")
 
-    df = state.excel_data.parse(
-        sheet_name=domain.get("worksheet_name"),
-        header=domain.get("worksheet_header_row", 4),
-    )
+    df, df_idx = _resolve_domain_and_row(state, domain, row_num)
 
-    urls = get_existing_urls(df, row_num - df_header_row, col_name=existing_url_header)
-    proposed = get_proposed_url(
-        df, row_num - df_header_row, col_name=proposed_url_header
-    )
+    urls = get_existing_urls(df, df_idx, col_name=existing_url_header)
+    proposed = get_proposed_url(df, df_idx, col_name=proposed_url_header)
 
     taxonomy = ""
     taxonomy_cols = [
@@ -58,7 +81,7 @@ def _extract_url_and_proposed_path(state, domain, row_num):
     ]
     if taxonomy_cols:
         debug_print(f"Found taxonomy column: {taxonomy_cols[0]}")
-        taxonomy = get_column_value(df, row_num - df_header_row, taxonomy_cols[0])
+        taxonomy = get_column_value(df, df_idx, taxonomy_cols[0])
 
     # sort the taxonomy values alphabetically and join with commas
     if taxonomy:
@@ -71,7 +94,40 @@ def _extract_url_and_proposed_path(state, domain, row_num):
     ]
     if template_cols:
         debug_print(f"Found template column: {template_cols[0]}")
-        template = get_column_value(df, row_num - df_header_row, template_cols[0])
+        template = get_column_value(df, df_idx, template_cols[0])
+
+    rows[key] = (tuple(urls or ()), proposed, taxonomy, template)
+    return urls, proposed, taxonomy, template
+
+
+def _extract_url_and_proposed_path(state, domain, row_num):
+    """Load URLs and proposed path for a domain/row and update state.
+
+    Parameters
+    ----------
+    state : object
+        Current CLI state object containing the loaded spreadsheet and variables.
+    domain : dict
+        Domain configuration dictionary from :data:`DOMAINS`.
+    row_num : int
+        Row number in the spreadsheet to load.
+
+    Returns
+    -------
+    tuple[list[str] | None, str | None]
+        ``(urls, proposed_path)`` if URLs were found, otherwise ``(None, None)``.
+    """
+
+    if not state.excel_data:
+        dsm_file = get_latest_dsm_file()
+        if not dsm_file:
+            raise RuntimeError(
+                "No DSM file found. Set DSM_FILE manually or place a dsm-*.xlsx file in the directory."
+            )
+        state.excel_data = load_spreadsheet(dsm_file)
+        state.set_variable("DSM_FILE", dsm_file)
+
+    urls, proposed, taxonomy, template = _read_dsm_row(state, domain, row_num)
 
     # Determine if this is a specialty detail page
     is_specialty_detail = False
@@ -103,33 +159,53 @@ def _extract_url_and_proposed_path(state, domain, row_num):
     return urls, proposed
 
 
-@validation_wrapper
-def cmd_load(args, state, *, validated=None):
-    """Load page information from the DSM spreadsheet.
+def load_row(state, domain, row_num):
+    """Load a single DSM row into state and report the outcome.
 
-    The command resolves ``<domain> <row>`` to an existing URL and proposed
-    path, updating the relevant state variables. Cached data is loaded when
-    available to avoid re-fetching page content.
+    Parameters
+    ----------
+    state : object
+        Current CLI state object.
+    domain : dict
+        Domain configuration dictionary from :data:`DOMAINS`.
+    row_num : int
+        Row number in the spreadsheet to load.
+
+    Returns
+    -------
+    list[str] | None
+        The existing URLs for the row, or ``None`` if nothing was loaded.
     """
     state.reset_page_context_state()
-
-    if validated:
-        domain, row_num = validated
-    else:
-        return
     try:
         urls, _ = _extract_url_and_proposed_path(state, domain, row_num)
         if not urls:
             print(f"❌ Could not find URL for {domain.get('full_name')} row {row_num}")
-            return
+            return None
 
         primary = urls[0]
         print(f"✅ Loaded URL: {primary[:60]}{'...' if len(primary) > 60 else ''}")
         if len(urls) > 1:
             print("⚠️  WARNING: Multiple existing URLs detected for this row.")
+        return urls
 
     except RuntimeError as e:
         print(f"❌ {e}")
     except Exception as e:
         print(f"❌ Error loading from spreadsheet: {e}")
         debug_print(f"Full error: {e}")
+    return None
+
+
+@validation_wrapper
+def cmd_load(args, state, *, validated=None):
+    """Load page information from the DSM spreadsheet.
+
+    The command resolves ``<domain> <row>`` to an existing URL and proposed
+    path, updating the relevant state variables. Cached data is loaded when
+    available to avoid re-fetching page content.
+    """
+    if not validated:
+        return
+    domain, row_num = validated
+    load_row(state, domain, row_num)
@@ -1,8 +1,7 @@
 from pathlib import Path
-import subprocess
-import sys
 
 from commands.common import print_help_for_command
+from utils.core import debug_print
 
 
 def cmd_profile(args, state):
@@ -14,7 +13,11 @@ def cmd_profile(args, state):
         print(f"❌ Script not found: {script_path}")
         return
 
+    # Run the script in-process rather than starting a new interpreter
     try:
-        subprocess.run([sys.executable, str(script_path)], check=True)
-    except subprocess.CalledProcessError as e:
+        from update_provider_profile_urls.update_provider_profile_urls import main
+
+        main()
+    except Exception as e:
         print(f"❌ Failed to run script: {e}")
+        debug_print(f"Full error: {e}")
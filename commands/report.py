@@ -1,31 +1,52 @@
+import os
 import re
-import sys
 import shutil
 import json
+import hashlib
 from html import escape
 from pathlib import Path
+from urllib.parse import urlparse
 from io import StringIO
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, repeat
+from string import Formatter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from commands.common import print_help_for_command
 from utils.core import debug_print
-from commands.core import _open_file_in_default_app
-
-from commands.load import cmd_load
+from commands.core import (
+    _open_file_in_default_app,
+    _open_files_in_default_app,
+    _clean_domain_name,
+)
+
+from commands.load import load_row
+from commands.check import _fetch_page_data, _report_fetch_errors
+from utils.cache import _cache_page_data, _is_cache_valid_for_context
+from constants import DOMAINS_BY_NAME, INTERNAL_HOSTNAMES
+from data.dsm import lookup_links_in_dsm
 from utils.core import display_page_data
 from utils.core import output_internal_links_analysis_detail
-from utils.sitecore import print_hierarchy, print_proposed_hierarchy
+from utils.sitecore import path_segments
+
+
+def _attr(value):
+    """Escape ``value`` for use inside a double-quoted HTML attribute."""
+    return escape(str(value), quote=True)
+
+
+def _jsstr(value):
+    """Return ``value`` as a JS string literal for an inline event handler."""
+    return _attr(json.dumps(str(value)))
 
 
 def _capture_output(func, *args, **kwargs):
-    """Capture stdout from a function call and return it as a string."""
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = StringIO()
-    try:
-        func(*args, **kwargs)
-        return captured_output.getvalue()
-    finally:
-        sys.stdout = old_stdout
+    """Return what ``func`` prints to the ``file`` writer it is handed."""
+    captured_output = StringIO()
+    func(*args, file=captured_output, **kwargs)
+    return captured_output.getvalue()
 
 
 def _build_sitecore_nav_js(path: list[str]) -> str:
@@ -47,16 +68,12 @@ def _extract_sitecore_paths(state):
             get_current_sitecore_root,
             get_proposed_sitecore_root,
         )
-        from html import escape
-        from urllib.parse import urlparse
 
         current_root = get_current_sitecore_root(url)
         proposed_root = get_proposed_sitecore_root(url)
 
         parsed = urlparse(url) if url else None
-        existing_segments = (
-            [seg for seg in parsed.path.strip("/").split("/") if seg] if parsed else []
-        )
+        existing_segments = path_segments(parsed.path) if parsed else []
 
         if proposed_path:
             # Strip domain from proposed path if it contains a full URL
@@ -73,9 +90,7 @@ def _extract_sitecore_paths(state):
                 parsed_proposed = urlparse(url_to_parse)
                 proposed_path = parsed_proposed.path
 
-            proposed_segments = [
-                seg for seg in proposed_path.strip("/").split("/") if seg
-            ]
+            proposed_segments = path_segments(proposed_path)
             if (
                 len(proposed_segments) >= 3
                 and proposed_segments[0] == "sitecore"
@@ -120,7 +135,7 @@ def _build_source_info_html(urls, domain, row, page_data):
     meta_robots = page_data.get("meta_robots", "")
 
     url_links = "<br>".join(
-        f"<a href=\"{u}\" onclick=\"window.open(this.href, '_blank', 'noopener,noreferrer,width=1200,height=1200'); return false;\">{u}</a>"
+        f"<a href=\"{_attr(u)}\" onclick=\"window.open(this.href, '_blank', 'noopener,noreferrer,width=1200,height=1200'); return false;\">{escape(u)}</a>"
         for u in urls
     )
 
@@ -134,8 +149,6 @@ def _build_source_info_html(urls, domain, row, page_data):
     """
 
     if meta_description:
-        from html import escape
-
         escaped_meta = escape(meta_description)
         if len(escaped_meta) > 200:
             escaped_meta = escaped_meta[:200] + "..."
@@ -178,6 +191,22 @@ def _build_taxonomy_html(taxonomy):
     """
 
 
+# Indentation for each depth of a rendered hierarchy tree
+_INDENTS = tuple("   " * depth for depth in range(32))
+
+
+def _indent(depth):
+    return _INDENTS[depth] if depth < len(_INDENTS) else "   " * depth
+
+
+def _hierarchy_tree_html(segments):
+    """Render path ``segments`` as an indented ``|--`` tree, one per line."""
+    return "".join(
+        f"{_indent(depth)}|-- {segment}<br>"
+        for depth, segment in enumerate(segments, 1)
+    )
+
+
 def _build_hierarchy_html(
     current_root,
     existing_segments,
@@ -202,9 +231,7 @@ def _build_hierarchy_html(
                         🏠 {current_root}<br>
     """
 
-    for i, segment in enumerate(existing_segments):
-        indent = "   " * (i + 1)
-        html += f"{indent}|-- {segment}<br>"
+    html += _hierarchy_tree_html(existing_segments)
 
     html += f"""
                     </div>
@@ -221,9 +248,7 @@ def _build_hierarchy_html(
 
     if proposed_segments:
         html += f"                        🏠 {proposed_root}<br>"
-        for i, segment in enumerate(proposed_segments):
-            indent = "   " * (i + 1)
-            html += f"{indent}|-- {segment}<br>"
+        html += _hierarchy_tree_html(proposed_segments)
     else:
         html += "                        <em>No proposed path set</em><br>"
 
@@ -237,22 +262,25 @@ def _build_hierarchy_html(
     return html
 
 
+# (item type, page data key) pairs in the order items appear in reports
+_PAGE_ITEM_KEYS = (
+    ("link", "links"),
+    ("sidebar_link", "sidebar_links"),
+    ("pdf", "pdfs"),
+    ("sidebar_pdf", "sidebar_pdfs"),
+    ("embed", "embeds"),
+    ("sidebar_embed", "sidebar_embeds"),
+)
+
+
 def _collect_page_items(page_data):
     """Collect all links, PDFs and embeds from page data."""
-    items = []
-    for link in page_data.get("links", []):
-        items.append(("link", link))
-    for link in page_data.get("sidebar_links", []):
-        items.append(("sidebar_link", link))
-    for pdf in page_data.get("pdfs", []):
-        items.append(("pdf", pdf))
-    for pdf in page_data.get("sidebar_pdfs", []):
-        items.append(("sidebar_pdf", pdf))
-    for embed in page_data.get("embeds", []):
-        items.append(("embed", embed))
-    for embed in page_data.get("sidebar_embeds", []):
-        items.append(("sidebar_embed", embed))
-    return items
+    return list(
+        chain.from_iterable(
+            zip(repeat(item_type), page_data.get(key, ()))
+            for item_type, key in _PAGE_ITEM_KEYS
+        )
+    )
 
 
 def _truncate_url_display(url: str, max_length: int = 80) -> str:
@@ -264,31 +292,95 @@ def _truncate_url_display(url: str, max_length: int = 80) -> str:
     return escape(url[:half] + "..." + url[-half:])
 
 
-def _build_link_item_html(item_type, item, state):
-    """Build the HTML for a single link/resource entry."""
-    if item_type in {"embed", "sidebar_embed"}:
-        title, src = item
-        debug_print(f"Processing embed: {title} ({src})")
-        escaped_title = escape(title)
-        escaped_src = escape(src, quote=True)
-        attr_safe_src = escape(src, quote=True).replace("'", "&#39;")
-        attr_safe_title = escape(title, quote=True).replace("'", "&#39;")
-        url_display = _truncate_url_display(src)
-        return f"""
+# Page item types whose entries are (title, src) embeds rather than links
+_EMBED_ITEM_TYPES = frozenset({"embed", "sidebar_embed"})
+
+
+def _is_internal_page_link(href):
+    """Return True if ``href`` points at a page on one of the site domains."""
+    if href.startswith(("tel:", "mailto:")) or href.lower().endswith(".pdf"):
+        return False
+    parsed = urlparse(href)
+    return (parsed.scheme in ("http", "https") or not parsed.scheme) and (
+        not parsed.hostname or parsed.hostname in INTERNAL_HOSTNAMES
+    )
+
+
+def _lookup_internal_links(items, state):
+    """Return DSM lookup results for the internal page links in ``items``.
+
+    All links are looked up in a single pass over the DSM. If the lookup
+    fails, each internal link maps to ``None``.
+    """
+    hrefs = [
+        item[1]
+        for item_type, item in items
+        if item_type not in _EMBED_ITEM_TYPES and _is_internal_page_link(item[1])
+    ]
+    try:
+        return lookup_links_in_dsm(hrefs, state.excel_data, state)
+    except Exception as e:
+        debug_print(f"Error looking up links in DSM: {e}")
+        return dict.fromkeys(hrefs)
+
+
+# Markup for entries in the links summary, filled with str.format; values
+# must already be escaped with escape(), _attr() or _jsstr() as appropriate
+_EMBED_ITEM_TMPL = """
                 <div class="link-item">
                     <div class="link-main">
-                        🎬 <a href="{escaped_src}" target="_blank">{escaped_title}</a>
-                        <button class="copy-btn" onclick="copyEmbedToClipboard(event, '{attr_safe_src}', '{attr_safe_title}')" title="Copy embed HTML">
+                        🎬 <a href="{src}" target="_blank">{title}</a>
+                        <button class="copy-btn" onclick="copyEmbedToClipboard(event, {src_js}, {title_js})" title="Copy embed HTML">
                             <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor">
                                 <path d="M16 1H4c-1.1 0-2 .9-2 2v14h2V3h12V1zm3 4H8c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h11c1.1 0 2-.9 2-2V7c0-1.1-.9-2-2-2zm0 16H8V7h11v14z"/>
                             </svg>
                         </button>
-                        <span class="item-type type-{item_type.replace('_', ' ')}">[{item_type.replace('_', ' ')}]</span>
+                        <span class="item-type type-{item_label}">[{item_label}]</span>
                     </div>
                     <div class="link-url">{url_display}</div>
                 </div>
             """
 
+_ANCHOR_COPY_BUTTON_TMPL = """
+                        <button class="copy-anchor-btn {link_kind}" onclick="copyAnchorToClipboard(event, {copy_js}, {text_js}, '{link_kind}')" title="Copy as HTML anchor">
+                            &lt;/&gt;
+                        </button>"""
+
+_LINK_ITEM_TMPL = """
+                <div class="link-item">
+                    <div class="link-main">
+                        {circle} <a href="{href}" target="_blank">{text}</a>
+                        <button class="copy-btn" onclick="copyToClipboard(event, {copy_js})" title="Copy URL">
+                            <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor">
+                                <path d="M16 1H4c-1.1 0-2 .9-2 2v14h2V3h12V1zm3 4H8c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h11c1.1 0 2-.9 2-2V7c0-1.1-.9-2-2-2zm0 16H8V7h11v14z"/>
+                            </svg>
+                        </button>{anchor_copy_button}
+                        <span class="item-type type-{item_label}">[{item_label}]</span>
+                    </div>
+                    {internal_hierarchy}
+                    <div class="link-url">{url_display}</div>
+                </div>
+            """
+
+
+def _build_link_item_html(item_type, item, lookups):
+    """Build the HTML for a single link/resource entry.
+
+    ``lookups`` maps internal page links to their DSM lookup result, as
+    returned by :func:`_lookup_internal_links`.
+    """
+    if item_type in _EMBED_ITEM_TYPES:
+        title, src = item
+        debug_print(f"Processing embed: {title} ({src})")
+        return _EMBED_ITEM_TMPL.format(
+            src=_attr(src),
+            title=escape(title),
+            src_js=_jsstr(src),
+            title_js=_jsstr(title),
+            item_label=item_type.replace("_", " "),
+            url_display=_truncate_url_display(src),
+        )
+
     text, href, status = item
     debug_print(f"Processing item: {item_type} - {text} ({href}) with status {status}")
     try:
@@ -311,87 +403,64 @@ def _build_link_item_html(item_type, item, state):
     is_contact_link = href.startswith(("tel:", "mailto:"))
     is_pdf_link = href.lower().endswith(".pdf")
 
-    from urllib.parse import urlparse
-    from constants import DOMAIN_MAPPING
-
-    parsed = urlparse(href)
-    href_hostname = parsed.hostname
-    scheme = parsed.scheme
-    internal_domains = set(DOMAIN_MAPPING.keys())
-    is_internal_page = (
-        not is_contact_link
-        and not is_pdf_link
-        and (scheme in ("http", "https") or not scheme)
-        and (not href_hostname or href_hostname in internal_domains)
-    )
     internal_hierarchy = ""
-    if is_internal_page:
-        try:
-            from data.dsm import lookup_link_in_dsm
-
-            lookup_result = lookup_link_in_dsm(href, state.excel_data, state)
-            hierarchy = (
-                lookup_result.get("proposed_hierarchy", {}) if lookup_result else {}
-            )
-            segments = hierarchy.get("segments", [])
-            root_name = hierarchy.get("root", "Sites")
-            internal_hierarchy = f"<div class='internal-hierarchy'>   → {root_name}"
-            for segment in segments:
-                internal_hierarchy += f" / {segment}"
-            internal_hierarchy += "</div>"
-        except Exception:
-            internal_hierarchy = "<div class='internal-hierarchy'>   → Sites</div>"
+    if href in lookups:
+        lookup_result = lookups[href]
+        hierarchy = lookup_result.get("proposed_hierarchy", {}) if lookup_result else {}
+        segments = hierarchy.get("segments", [])
+        root_name = hierarchy.get("root", "Sites")
+        path = "".join(f" / {segment}" for segment in segments)
+        internal_hierarchy = (
+            f"<div class='internal-hierarchy'>   → {root_name}{path}</div>"
+        )
 
     anchor_copy_button = ""
     link_kind = "contact" if is_contact_link else "pdf"
     if is_contact_link or is_pdf_link:
-        anchor_copy_button = f"""
-                        <button class="copy-anchor-btn {link_kind}" onclick="copyAnchorToClipboard(event, '{copy_value}', '{text}', '{link_kind}')" title="Copy as HTML anchor">
-                            &lt;/&gt;
-                        </button>"""
+        anchor_copy_button = _ANCHOR_COPY_BUTTON_TMPL.format(
+            link_kind=link_kind, copy_js=_jsstr(copy_value), text_js=_jsstr(text)
+        )
 
-    url_display = _truncate_url_display(href)
-    return f"""
-                <div class="link-item">
-                    <div class="link-main">
-                        {circle} <a href="{href}" target="_blank">{text}</a>
-                        <button class="copy-btn" onclick="copyToClipboard(event, '{copy_value}')" title="Copy URL">
-                            <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor">
-                                <path d="M16 1H4c-1.1 0-2 .9-2 2v14h2V3h12V1zm3 4H8c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h11c1.1 0 2-.9 2-2V7c0-1.1-.9-2-2-2zm0 16H8V7h11v14z"/>
-                            </svg>
-                        </button>{anchor_copy_button}
-                        <span class="item-type type-{item_type.replace('_', ' ')}">[{item_type.replace('_', ' ')}]</span>
-                    </div>
-                    {internal_hierarchy}
-                    <div class="link-url">{url_display}</div>
-                </div>
-            """
+    return _LINK_ITEM_TMPL.format(
+        circle=circle,
+        href=_attr(href),
+        text=escape(text),
+        copy_js=_jsstr(copy_value),
+        anchor_copy_button=anchor_copy_button,
+        item_label=item_type.replace("_", " "),
+        internal_hierarchy=internal_hierarchy,
+        url_display=_truncate_url_display(href),
+    )
 
 
 def _build_links_summary_html(items, state):
     """Build the links/resources summary section."""
-    html = '<div class="links-summary"><h3>🔗 Found Links & Resources</h3>'
+    header = '<div class="links-summary"><h3>🔗 Found Links & Resources</h3>'
     if not items:
-        html += "<p><em>No links or resources found.</em></p></div>"
-        return html
+        return header + "<p><em>No links or resources found.</em></p></div>"
 
-    html += '<div class="links-list">'
-    for item_type, item in items:
-        html += _build_link_item_html(item_type, item, state)
-    html += "</div></div>"
-    return html
+    lookups = _lookup_internal_links(items, state)
+    parts = [header, '<div class="links-list">']
+    parts.extend(
+        _build_link_item_html(item_type, item, lookups) for item_type, item in items
+    )
+    parts.append("</div></div>")
+    return "".join(parts)
 
 
 def _generate_consolidated_section(state):
     """Generate the consolidated section with enhanced link display."""
-    urls = state.get_variable("EXISTING_URLS") or []
-    url = urls[0] if urls else state.get_variable("URL")
-    domain = state.get_variable("DOMAIN")
-    row = state.get_variable("ROW")
-
-    if not state.current_page_data:
+    page_data = state.current_page_data
+    if not page_data:
         return "<p>No page data available.</p>"
 
+    get_var = state.get_variable
+    urls = get_var("EXISTING_URLS") or []
+    url = urls[0] if urls else get_var("URL")
+    domain = get_var("DOMAIN")
+    row = get_var("ROW")
+    taxonomy = get_var("TAXONOMY")
+
     (
         current_root,
         existing_segments,
@@ -401,10 +470,7 @@ def _generate_consolidated_section(state):
         escaped_proposed_js,
     ) = _extract_sitecore_paths(state)
 
-    source_html = _build_source_info_html(
-        urls or [url], domain, row, state.current_page_data
-    )
-    taxonomy = state.get_variable("TAXONOMY")
+    source_html = _build_source_info_html(urls or [url], domain, row, page_data)
     taxonomy_html = _build_taxonomy_html(taxonomy)
     hierarchy_html = _build_hierarchy_html(
         current_root,
@@ -414,7 +480,7 @@ def _generate_consolidated_section(state):
         proposed_segments,
         escaped_proposed_js,
     )
-    items = _collect_page_items(state.current_page_data)
+    items = _collect_page_items(page_data)
     links_html = _build_links_summary_html(items, state)
 
     html = f"""
@@ -431,29 +497,30 @@ def _generate_consolidated_section(state):
     return html
 
 
-def _get_copy_value(href):
+# Strips everything but digits from tel: numbers
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
+
+def _get_copy_value(href, parsed=None):
+    """Return the value copied for ``href``; ``parsed`` may be its ``urlparse`` result."""
     if href.startswith("tel:"):
         phone = href.replace("tel:", "").strip()
-        digits_only = re.sub(r"[^\d]", "", phone)
+        digits_only = _NON_DIGIT_RE.sub("", phone)
         if len(digits_only) == 10:
             return f"tel:+1{digits_only}"
         elif len(digits_only) == 11 and digits_only.startswith("1"):
             return f"tel:+{digits_only}"
         else:
             return href
-    elif href.lower().endswith(".pdf") or "/pdf/" in href.lower():
-        from urllib.parse import urlparse
-
-        parsed = urlparse(href)
-        return parsed.path
+    href_lower = href.lower()
+    if href_lower.endswith(".pdf") or "/pdf/" in href_lower:
+        return (parsed or urlparse(href)).path
     else:
         return href
 
 
 def _format_display_url(url: str, max_length: int = 60) -> str:
     """Format a URL for display, truncating the middle if it is too long."""
-    from html import escape
-
     escaped = escape(url)
     if len(escaped) <= max_length:
         return escaped
@@ -461,12 +528,35 @@ def _format_display_url(url: str, max_length: int = 60) -> str:
     return f"{escaped[:half]}...{escaped[-half:]}"
 
 
+# Escapes captured console output for embedding in the report in a single pass
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
 def _get_report_template_dir():
     template_dir = Path("templates/report")
     template_dir.mkdir(exist_ok=True)
     return template_dir
 
 
+def _load_report_template():
+    """Return the report template, re-reading it only when the file changes."""
+    template_path = _get_report_template_dir() / "template.html"
+    return _read_report_template(
+        str(template_path.resolve()), template_path.stat().st_mtime_ns
+    )
+
+
+@lru_cache(maxsize=4)
+def _read_report_template(path, mtime_ns):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4)
+def _parse_report_template(template):
+    return tuple(Formatter().parse(template))
+
+
 def _generate_html_report(
     domain,
     row,
@@ -475,14 +565,18 @@ def _generate_html_report(
     consolidated_output,
     kanban_id=None,
     is_specialty_detail=False,
+    out=None,
 ):
-    template_dir = _get_report_template_dir()
-    template_path = template_dir / "template.html"
+    """Fill the report template with the given sections.
+
+    When ``out`` is given the report is written to that file object piece by
+    piece and nothing is returned; otherwise the report is returned as a string.
+    """
     try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+        template = _load_report_template()
     except Exception as e:
         print(f"⛔️ ERROR: Failed to read template:\n'{e}'")
+        raise
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     kanban_html = ""
@@ -501,17 +595,31 @@ def _generate_html_report(
         specialty_class = "specialty-detail"
         debug_print("Report marked as specialty detail page")
 
-    return template.format(
-        domain=domain,
-        row=row,
-        kanban_url=kanban_html,
-        specialty_banner=specialty_banner,
-        specialty_class=specialty_class,
-        consolidated_output=consolidated_output,
-        show_page_output=show_page_output.replace("<", "&lt;").replace(">", "&gt;"),
-        links_output=links_output.replace("<", "&lt;").replace(">", "&gt;"),
-        timestamp=timestamp,
-    )
+    values = {
+        "domain": domain,
+        "row": row,
+        "kanban_url": kanban_html,
+        "specialty_banner": specialty_banner,
+        "specialty_class": specialty_class,
+        "consolidated_output": consolidated_output,
+        "show_page_output": show_page_output.translate(_HTML_ESCAPE_TABLE),
+        "links_output": links_output.translate(_HTML_ESCAPE_TABLE),
+        "timestamp": timestamp,
+    }
+    if out is None:
+        return template.format(**values)
+    _write_template(out, template, values)
+
+
+def _write_template(out, template, values):
+    """Write ``template`` filled from ``values`` to ``out`` one field at a time."""
+    for literal, field, spec, conversion in _parse_report_template(template):
+        out.write(literal)
+        if field is not None:
+            value = values[field]
+            if conversion:
+                value = {"r": repr, "s": str, "a": ascii}[conversion](value)
+            out.write(format(value, spec))
 
 
 # check.py
@@ -520,12 +628,134 @@ def _sync_report_static_assets(reports_dir):
     for file in template_dir.glob("*"):
         if file.suffix in {".css", ".js"}:
             dest = reports_dir / file.name
-            shutil.copy(file, dest)
+            # Skip assets the reports dir already has an up-to-date copy of
+            src_stat = file.stat()
+            try:
+                dest_stat = dest.stat()
+            except FileNotFoundError:
+                dest_stat = None
+            if (
+                dest_stat is not None
+                and dest_stat.st_size == src_stat.st_size
+                and dest_stat.st_mtime >= src_stat.st_mtime
+            ):
+                continue
+            shutil.copyfile(file, dest)
+
+
+# Variables that the captured report sections depend on
+_REPORT_SECTION_VARS = (
+    "URL",
+    "EXISTING_URLS",
+    "SELECTOR",
+    "INCLUDE_SIDEBAR",
+    "DOMAIN",
+    "ROW",
+    "PROPOSED_PATH",
+    "TAXONOMY",
+    "DSM_FILE",
+)
+
+
+# Most captured report sections kept on the state at once
+_REPORT_FRAGMENTS_MAX = 8
+
+
+def _mtime_ns(path):
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _capture_report_sections(state, cache_file, force_regenerate=False):
+    """Return the page data, links analysis and consolidated report sections.
+
+    When the page data came from a cache file, the sections are memoised on
+    ``state._report_fragments`` keyed by the report context and the cache
+    and DSM files' mtimes, so regenerating a report for an unchanged page
+    skips the DSM lookups behind the links analysis. Only the most recent
+    few contexts are kept. ``force_regenerate`` always captures afresh.
+    """
+    key = None
+    mtime_ns = _mtime_ns(cache_file) if cache_file else None
+    if mtime_ns is not None:
+        dsm_file = state.get_variable("DSM_FILE")
+        key = (
+            str(cache_file),
+            mtime_ns,
+            _mtime_ns(dsm_file) if dsm_file else None,
+            *(repr(state.get_variable(name)) for name in _REPORT_SECTION_VARS),
+        )
+
+    fragments = getattr(state, "_report_fragments", None)
+    if not isinstance(fragments, OrderedDict):
+        fragments = state._report_fragments = OrderedDict()
+    if key is not None and key in fragments and not force_regenerate:
+        print("  ▶ Reusing captured report sections...")
+        fragments.move_to_end(key)
+        return fragments[key]
+
+    print("  ▶ Capturing page data...")
+    if state.current_page_data:
+        show_page_output = _capture_output(display_page_data, state.current_page_data)
+    else:
+        show_page_output = "❌ No page data available. Run 'check' first."
+
+    print("  ▶ Capturing links analysis...")
+    links_output = _capture_output(output_internal_links_analysis_detail, state)
+
+    print("  ▶ Generating consolidated summary...")
+    consolidated_output = _generate_consolidated_section(state)
+
+    sections = (show_page_output, links_output, consolidated_output)
+    if key is not None:
+        fragments[key] = sections
+        fragments.move_to_end(key)
+        while len(fragments) > _REPORT_FRAGMENTS_MAX:
+            fragments.popitem(last=False)
+    return sections
+
+
+# Variables baked into a report besides its captured sections
+_REPORT_FINGERPRINT_VARS = (*_REPORT_SECTION_VARS, "KANBAN_ID", "IS_SPECIALTY_DETAIL")
+
+
+def _report_fingerprint_path(report_path):
+    return Path(f"{report_path}.hash")
 
 
-def _generate_report(state, prompt_open=True, force_regenerate=False):
-    from utils.cache import _is_cache_valid_for_context
+def _report_fingerprint(state):
+    """Return a digest of the page data and variables a report is built from."""
+    payload = json.dumps(
+        [
+            state.current_page_data,
+            [state.get_raw_variable(name) for name in _REPORT_FINGERPRINT_VARS],
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _report_is_current(state, report_path):
+    """Return True if ``report_path`` was built from the current page data.
+
+    Cache files carry a timestamp and are rewritten on every check, so a
+    newer cache file doesn't necessarily mean the report is out of date.
+    """
+    try:
+        stored = _report_fingerprint_path(report_path).read_text(encoding="utf-8")
+    except OSError:
+        return False
+    return stored.strip() == _report_fingerprint(state)
 
+
+# Write buffer for report files, so a report goes out in a few large writes
+_REPORT_WRITE_BUFFER = 1 << 20
+
+
+def _generate_report(state, prompt_open=True, force_regenerate=False, sync_assets=True):
     need_to_check = False
     if not state.current_page_data:
         need_to_check = True
@@ -548,20 +778,23 @@ def _generate_report(state, prompt_open=True, force_regenerate=False):
     else:
         print("📋 Using existing cached page data for report")
 
-    domain = state.get_variable("DOMAIN") or "unknown"
-    row = state.get_variable("ROW") or "unknown"
+    # Read the report context once; cmd_check above may have updated it
+    get_var = state.get_variable
+    domain = get_var("DOMAIN") or "unknown"
+    row = get_var("ROW") or "unknown"
+    cache_file = get_var("CACHE_FILE")
+    kanban_id = get_var("KANBAN_ID")
+    is_specialty_detail = get_var("IS_SPECIALTY_DETAIL") == "true"
 
     reports_dir = Path("./reports")
     reports_dir.mkdir(exist_ok=True)
 
-    clean_domain = re.sub(r"[^a-zA-Z0-9]", "_", domain.lower())
+    clean_domain = _clean_domain_name(domain)
     filename = f"./reports/{clean_domain}_{row}.html"
 
     report_path = Path(filename)
 
     if report_path.exists() and not force_regenerate:
-        cache_file = state.get_variable("CACHE_FILE")
-
         if cache_file:
             try:
                 report_mtime = report_path.stat().st_mtime
@@ -570,7 +803,14 @@ def _generate_report(state, prompt_open=True, force_regenerate=False):
                 if cache_path.exists():
                     cache_mtime = cache_path.stat().st_mtime
 
-                    if report_mtime >= cache_mtime:
+                    if report_mtime >= cache_mtime or _report_is_current(
+                        state, report_path
+                    ):
+                        if report_mtime < cache_mtime:
+                            # The fingerprint matched a rewritten cache file; bump
+                            # the report's mtime so the next check is settled by
+                            # the timestamps alone
+                            report_path.touch()
                         print(f"📋 Report already exists and is up-to-date: {filename}")
                         if prompt_open:
                             prompt_to_open_report(report_path)
@@ -591,40 +831,39 @@ def _generate_report(state, prompt_open=True, force_regenerate=False):
     else:
         print(f"📊 Generating report: {filename}")
 
-    print("  ▶ Capturing page data...")
-    if state.current_page_data:
-        show_page_output = _capture_output(display_page_data, state.current_page_data)
-    else:
-        show_page_output = "❌ No page data available. Run 'check' first."
-
-    print("  ▶ Capturing links analysis...")
-    links_output = _capture_output(output_internal_links_analysis_detail, state)
-
-    print("  ▶ Generating consolidated summary...")
-    consolidated_output = _generate_consolidated_section(state)
-
-    print("  ▶ Generating HTML...")
-    kanban_id = state.get_variable("KANBAN_ID")
-    is_specialty_detail = state.get_variable("IS_SPECIALTY_DETAIL") == "true"
-    html_content = _generate_html_report(
-        domain,
-        row,
-        show_page_output,
-        links_output,
-        consolidated_output,
-        kanban_id,
-        is_specialty_detail,
+    show_page_output, links_output, consolidated_output = _capture_report_sections(
+        state, cache_file, force_regenerate
     )
 
+    print("  ▶ Generating HTML...")
+    # Write to a temporary file and move it into place once it is complete, so
+    # a failed write never leaves a partial report that looks up to date
+    tmp_path = report_path.with_name(f".{report_path.name}.tmp")
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        with open(tmp_path, "w", encoding="utf-8", buffering=_REPORT_WRITE_BUFFER) as f:
+            _generate_html_report(
+                domain,
+                row,
+                show_page_output,
+                links_output,
+                consolidated_output,
+                kanban_id,
+                is_specialty_detail,
+                out=f,
+            )
+        os.replace(tmp_path, report_path)
+        _report_fingerprint_path(report_path).write_text(
+            _report_fingerprint(state), encoding="utf-8"
+        )
         print(f"✅ Report saved to: {filename}")
         print(f"💡 Open the file in your browser to view the report")
     except Exception as e:
         print(f"❌ Failed to save report: {e}")
+        tmp_path.unlink(missing_ok=True)
 
-    _sync_report_static_assets(reports_dir)
+    # Bulk runs sync the static assets once for the whole batch instead
+    if sync_assets:
+        _sync_report_static_assets(reports_dir)
 
     if prompt_open:
         open_report_now = (
@@ -658,6 +897,77 @@ def prompt_to_open_report(report_path):
             debug_print(f"Full error: {e}")
 
 
+def _load_rows_for_domain(state, domain, rows):
+    """Load each requested row of ``domain`` into state in turn.
+
+    The domain is resolved once by the caller, and the worksheet parse is
+    shared across rows by the cached Excel wrapper. Yields each row that
+    resolved to a URL.
+    """
+    for row in rows:
+        try:
+            row_num = int(row)
+        except ValueError:
+            print(f"❌ Row number must be an integer: {row}")
+            continue
+        if load_row(state, domain, row_num):
+            yield row
+
+
+# Upper bound on concurrent page fetches for multi-row reports
+_REPORT_FETCH_WORKERS = 8
+
+
+def _prefetch_rows(state, domain, rows):
+    """Load each row and fetch any missing page data concurrently.
+
+    Rows are loaded one at a time on the calling thread and their variables
+    are snapshotted. Rows without valid cached page data are then fetched in
+    a thread pool, since the work is dominated by network latency.
+
+    Returns a list of ``(variables, page_data, fetched)`` tuples, where
+    ``fetched`` is freshly retrieved page data or ``None``.
+    """
+    get_var = state.get_variable
+    snapshots = []
+    pending = {}
+    for row in _load_rows_for_domain(state, domain, rows):
+        snapshots.append((dict(state.variables), state.current_page_data, None))
+        is_valid, _ = _is_cache_valid_for_context(state, get_var("CACHE_FILE"))
+        if state.current_page_data and is_valid:
+            continue
+        urls = get_var("EXISTING_URLS") or [get_var("URL")]
+        if urls and urls[0]:
+            pending[len(snapshots) - 1] = (
+                urls,
+                get_var("SELECTOR"),
+                get_var("INCLUDE_SIDEBAR"),
+            )
+
+    if not pending:
+        return snapshots
+
+    print(f"🔄 Fetching page data for {len(pending)} rows...")
+    workers = min(_REPORT_FETCH_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_fetch_page_data, *fetch_args): idx
+            for idx, fetch_args in pending.items()
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                fetched, errors = future.result()
+            except Exception as e:
+                print(f"❌ Error during page check: {e}")
+                continue
+            _report_fetch_errors(errors)
+            variables, page_data, _ = snapshots[idx]
+            snapshots[idx] = (variables, page_data, fetched or None)
+
+    return snapshots
+
+
 def cmd_report(args, state):
     force_regenerate = False
     if args and args[0] in ["--force", "-f"]:
@@ -669,19 +979,43 @@ def cmd_report(args, state):
         if first_row_idx is None:
             return print_help_for_command("report", state)
 
-        domain = " ".join(args[:first_row_idx])
+        domain_name = " ".join(args[:first_row_idx])
+        domain = DOMAINS_BY_NAME.get(domain_name.lower())
+        if not domain:
+            print(f"❌ Domain '{domain_name}' not found.")
+            return
+
         rows = args[first_row_idx:]
         report_files = []
 
-        for row in rows:
-            cmd_load([domain, row], state)
+        snapshots = []
+        for variables, page_data, fetched in _prefetch_rows(state, domain, rows):
+            state.variables.update(variables)
+            state.current_page_data = page_data
+            if fetched:
+                state.current_page_data = fetched
+                urls = state.get_variable("EXISTING_URLS") or [
+                    state.get_variable("URL")
+                ]
+                _cache_page_data(state, urls[0], fetched)
+            snapshots.append((dict(state.variables), state.current_page_data))
+
+        # Reports are built one at a time on this state, so every row's link
+        # lookups share the DSM index it has already built
+        for variables, page_data in snapshots:
+            state.variables.update(variables)
+            state.current_page_data = page_data
             report_file = _generate_report(
-                state, prompt_open=False, force_regenerate=force_regenerate
+                state,
+                prompt_open=False,
+                force_regenerate=force_regenerate,
+                sync_assets=False,
             )
             if report_file:
                 report_files.append(report_file)
 
         if report_files:
+            _sync_report_static_assets(Path("./reports"))
             open_now = (
                 input(
                     f"Open {len(report_files)} report{'s' if len(report_files)>1 else ''} in your browser now? [Y/n]: "
@@ -690,11 +1024,8 @@ def cmd_report(args, state):
                 .lower()
             )
             if open_now in ["", "y", "yes"]:
-                for rf in report_files:
-                    try:
-                        _open_file_in_default_app(rf)
-                    except Exception as e:
-                        print(f"❌ Failed to open report {rf}: {e}")
+                for rf, e in _open_files_in_default_app(report_files):
+                    print(f"❌ Failed to open report {rf}: {e}")
         return
 
     _generate_report(state, prompt_open=True, force_regenerate=force_regenerate)
@@ -1,4 +1,9 @@
-DOMAINS = [
+from functools import lru_cache, partial
+from types import MappingProxyType
+from urllib.parse import urlparse
+
+# Site domain settings, wrapped read-only in DOMAINS below
+_DOMAIN_SETTINGS = (
     {
         "full_name": "Enterprise",
         "worksheet_name": "Enterprise",
@@ -30,7 +35,7 @@ DOMAINS = [
     {
         "full_name": "Hollings Cancer",
         "worksheet_name": "Hollings Cancer",
-        "aliases": ["Hollings Cancer Center", "HCC"],  # alternative full_name values
+        "aliases": ("Hollings Cancer Center", "HCC"),  # alternative full_name values
         "sitecore_domain_name": "Hollings",
         "url": "hollingscancercenter.musc.edu",
         "worksheet_header_row": 3,
@@ -38,7 +43,7 @@ DOMAINS = [
     {
         "full_name": "Childrens Health",
         "worksheet_name": "Childrens Health",
-        "aliases": ["Children's Health", "Kids"],  # alternative full_name values
+        "aliases": ("Children's Health", "Kids"),  # alternative full_name values
         "sitecore_domain_name": "Kids",
         "url": "musckids.org",
         "worksheet_header_row": 3,
@@ -106,65 +111,136 @@ DOMAINS = [
         "full_name": "Progress Notes",
         "worksheet_name": "ProgressNotes",
         "sitecore_domain_name": "Content Hub",
-        "aliases": ["ProgressNotes"],  # alternative full_name values
+        "aliases": ("ProgressNotes",),  # alternative full_name values
         "url": "muschealth.org/health-professionals/progressnotes",
         "worksheet_header_row": 0,
         "existing_url_col_name": "Current URL",
         "proposed_url_col_name": "proposed path",
         "root_for_new_sitecore": "Content Hub",
     },
-]
+)
+
+# Site domains; read-only views, since the table is fixed for the life of the
+# process and the same entries are shared by every lookup table below
+DOMAINS = tuple(MappingProxyType(domain) for domain in _DOMAIN_SETTINGS)
+
+
+def dsm_row_offset(domain):
+    """Return the offset between a spreadsheet row number and its DataFrame index.
+
+    That is the header row itself plus Excel's 1-based numbering.
+    """
+    return domain.get("worksheet_header_row", 4) + 2
+
 
 DOMAIN_MAPPING = {
     domain["url"]: domain["sitecore_domain_name"] for domain in DOMAINS if domain["url"]
 }
 
+# Domains by the hostname of their "url", in DOMAINS order; entries whose
+# "url" includes a path share a host with the site they live under
+_by_hostname = {}
+for _domain in DOMAINS:
+    if _domain["url"]:
+        _hostname = urlparse("//" + _domain["url"]).hostname
+        _by_hostname.setdefault(_hostname, []).append(_domain)
+DOMAINS_BY_HOSTNAME = {
+    hostname: tuple(domains) for hostname, domains in _by_hostname.items()
+}
+del _domain, _hostname, _by_hostname
+
+# Hostnames of the site domains, for matching against urlparse(href).hostname
+INTERNAL_HOSTNAMES = frozenset(DOMAINS_BY_HOSTNAME)
+
+# (url, root) for domains that move under a different root in the new Sitecore
+NEW_SITECORE_ROOTS = tuple(
+    (domain["url"], domain["root_for_new_sitecore"])
+    for domain in DOMAINS
+    if domain["url"] and domain.get("root_for_new_sitecore")
+)
+
+# Domain full names in display order
+DOMAIN_NAMES = tuple(domain["full_name"] for domain in DOMAINS)
+
+# Case-insensitive lookup of a domain by its full name or any alias
+DOMAINS_BY_NAME = {
+    name.lower(): domain
+    for domain in DOMAINS
+    for name in (domain["full_name"], *domain.get("aliases", ()))
+}
+
+
+@lru_cache(maxsize=None)
+def _command_handler(module_name, func_name):
+    """Import ``module_name`` and return its ``func_name``, once per command."""
+    from importlib import import_module
+
+    return getattr(import_module(module_name), func_name)
+
+
+def _run_command(module_name, func_name, state, args):
+    """Import ``module_name`` on first use and call its ``func_name``.
+
+    The handler gets ``(args, state)``, or just ``args`` when ``state`` is
+    ``None``.
+    """
+    handler = _command_handler(module_name, func_name)
+    return handler(args) if state is None else handler(args, state)
+
+
+def _run_command_with_args(module_name, func_name, fixed_args, state, args):
+    """Run a command alias that always passes ``fixed_args``."""
+    return _run_command(module_name, func_name, state, fixed_args)
+
+
+def _exit(args):
+    exit(0)
+
+
+# Command name -> (module, handler); the handlers take (args, state)
+_COMMAND_TABLE = {
+    "bulk_check": ("commands.bulk", "cmd_bulk_check"),
+    "bulk": ("commands.bulk", "cmd_bulk_check"),  # Alias for bulk
+    "check": ("commands.check", "cmd_check"),
+    "debug": ("commands.common", "cmd_debug"),
+    "dsm": ("commands.dsm", "cmd_dsm"),
+    "help": ("commands.common", "cmd_help"),
+    "history": ("commands.history", "cmd_history"),
+    "links": ("commands.core", "cmd_links"),
+    "load": ("commands.load", "cmd_load"),
+    "open": ("commands.core", "cmd_open"),
+    "report": ("commands.report", "cmd_report"),
+    "set": ("commands.core", "cmd_set"),
+    "profile": ("commands.profile", "cmd_profile"),
+    "sidebar": ("commands.sidebar", "cmd_sidebar"),
+    "show": ("commands.core", "cmd_show"),
+}
+
 
 def get_commands(state):
     """Build a mapping of command names to callable handlers.
 
-    The command modules are imported lazily to keep start-up fast. Each
-    command name is associated with a ``lambda`` that injects the shared
-    ``state`` object when invoking the real implementation.
+    The command modules are imported lazily, on the first call to a command,
+    to keep start-up fast. Each command name is associated with a
+    ``functools.partial`` that injects the shared ``state`` object when
+    invoking the real implementation. The mapping is built once per ``state``
+    and kept on it as ``state._commands``.
     """
-    from commands.core import (
-        cmd_links,
-        cmd_open,
-        cmd_set,
-        cmd_show,
-    )
-    from commands.sidebar import cmd_sidebar
-    from commands.load import cmd_load
-    from commands.report import cmd_report
-    from commands.clear import cmd_clear
-    from commands.common import cmd_help, cmd_debug
-    from commands.bulk import cmd_bulk_check
-    from commands.check import cmd_check
-    from commands.profile import cmd_profile
-    from commands.history import cmd_history
-    from commands.dsm import cmd_dsm
-
-    return {
-        "bulk_check": lambda args: cmd_bulk_check(args, state),
-        "bulk": lambda args: cmd_bulk_check(args, state),  # Alias for bulk
-        "check": lambda args: cmd_check(args, state),
-        "clear": lambda args: cmd_clear(args),
-        "debug": lambda args: cmd_debug(args, state),
-        "dsm": lambda args: cmd_dsm(args, state),
-        "help": lambda args: cmd_help(args, state),
-        "history": lambda args: cmd_history(args, state),
-        "links": lambda args: cmd_links(args, state),
-        "load": lambda args: cmd_load(args, state),
-        "open": lambda args: cmd_open(args, state),
-        "report": lambda args: cmd_report(args, state),
-        "set": lambda args: cmd_set(args, state),
-        "profile": lambda args: cmd_profile(args, state),
-        "sidebar": lambda args: cmd_sidebar(args, state),
-        "show": lambda args: cmd_show(args, state),
-        # Aliases
-        "vars": lambda args: cmd_show(["variables"], state),
-        "ls": lambda args: cmd_show(["variables"], state),
-        "exit": lambda args: exit(0),
-        "quit": lambda args: exit(0),
-        "q": lambda args: exit(0),
+    if state._commands is None:
+        state._commands = _build_commands(state)
+    return state._commands
+
+
+def _build_commands(state):
+    commands = {
+        name: partial(_run_command, module_name, func_name, state)
+        for name, (module_name, func_name) in _COMMAND_TABLE.items()
     }
+    commands["clear"] = partial(_run_command, "commands.clear", "cmd_clear", None)
+    # Aliases
+    show_variables = partial(
+        _run_command_with_args, "commands.core", "cmd_show", ["variables"], state
+    )
+    commands["vars"] = commands["ls"] = show_variables
+    commands["exit"] = commands["quit"] = commands["q"] = _exit
+    return commands
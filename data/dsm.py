@@ -4,34 +4,43 @@ DSM/Spreadsheet utilities for Linker CLI.
 
 import os
 import re
-import glob
+from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urlparse
-import pandas as pd
 from pathlib import Path
 from time import perf_counter
+from types import MappingProxyType
 
-from constants import DOMAINS
+from constants import DOMAINS, DOMAINS_BY_HOSTNAME
 
-from utils.core import debug_print
+from utils.core import debug_print, is_debug_enabled
+from utils.sitecore import get_sitecore_root
+
+
+def _make_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_make_hashable(v) for v in value)
+    return value
 
 
 class CachedExcelFile:
-    """Wrapper around :class:`pandas.ExcelFile` that memoises parsed worksheets."""
+    """Wrapper around :class:`pandas.ExcelFile` that memoises parsed worksheets.
 
-    def __init__(self, excel_file):
+    At most ``max_cached`` parsed worksheets are kept; the least recently
+    used one is dropped when the limit is reached. The default leaves room
+    for every sheet a link lookup visits, so a full scan doesn't evict the
+    sheets it is about to need again.
+    """
+
+    def __init__(self, excel_file, max_cached=32):
         self._excel_file = excel_file
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._max_cached = max_cached
 
     def parse(self, sheet_name=None, header=0, **kwargs):
         """Parse a worksheet, caching the resulting DataFrame by parameters."""
-
-        def _make_hashable(value):
-            if isinstance(value, dict):
-                return tuple(sorted((k, _make_hashable(v)) for k, v in value.items()))
-            if isinstance(value, (list, tuple, set)):
-                return tuple(_make_hashable(v) for v in value)
-            return value
-
         cache_key = (
             _make_hashable(sheet_name),
             _make_hashable(header),
@@ -51,8 +60,11 @@ class CachedExcelFile:
                 header=header,
                 **kwargs,
             )
+            if len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
         else:
-            debug_print(f"⚡ Using cached dataframe for {sheet_name or 'default'}")
+            debug_print("⚡ Using cached dataframe for", sheet_name or "default")
+            self._cache.move_to_end(cache_key)
 
         return self._cache[cache_key]
 
@@ -79,39 +91,85 @@ class CachedExcelFile:
 DSM_DIR = Path(".")
 
 
+# (pattern, directory mtime) and result of the last DSM file search
+_latest_dsm_search = None
+
+
 def get_latest_dsm_file():
-    pattern = str(DSM_DIR / "dsm-*.xlsx")
-    files = glob.glob(pattern)
+    """Return the newest ``dsm-MMDD.xlsx`` in :data:`DSM_DIR`, or ``None``.
+
+    The result is reused until the directory's mtime changes, i.e. until a
+    file is added, removed or renamed in it.
+    """
+    global _latest_dsm_search
+    dsm_dir = DSM_DIR
+    try:
+        search_key = (str(dsm_dir), os.stat(dsm_dir).st_mtime_ns)
+    except OSError:
+        search_key = None
+    if _latest_dsm_search is not None and _latest_dsm_search[0] == search_key:
+        return _latest_dsm_search[1]
+
+    latest = _find_latest_dsm_file(dsm_dir)
+    if search_key is not None:
+        _latest_dsm_search = (search_key, latest)
+    return latest
+
 
-    debug_print(f"Searching for DSM files with pattern: {pattern}")
-    debug_print(f"Found files: {files}")
+def _find_latest_dsm_file(dsm_dir):
+    debug_print(f"Searching for DSM files in: {dsm_dir}")
 
     latest = None
     latest_date = None
 
-    for f in files:
-        basename = os.path.basename(f)
-        m = re.match(r"dsm-(\d{4})\.xlsx", basename)
-
-        if m:
-            dt = m.group(1)
-            try:
-                month = int(dt[:2])
-                day = int(dt[2:])
-                date = (month, day)
-                if latest_date is None or date > latest_date:
-                    latest_date = date
-                    latest = f
-                    debug_print(f"New latest DSM candidate: {f} (date {date})")
-            except ValueError:
-                debug_print(f"Skipping invalid DSM filename: {basename}")
+    try:
+        entries = os.scandir(dsm_dir)
+    except OSError as e:
+        debug_print(f"Cannot list DSM directory {dsm_dir}: {e}")
+        return None
+
+    with entries:
+        for entry in entries:
+            # DSM workbooks are named dsm-MMDD.xlsx
+            name = entry.name
+            if not (
+                len(name) == 13
+                and name.startswith("dsm-")
+                and name.endswith(".xlsx")
+                and name[4:8].isdecimal()
+            ):
                 continue
-
+            date = (int(name[4:6]), int(name[6:8]))
+            if latest_date is None or date > latest_date:
+                latest_date = date
+                latest = name
+                debug_print(f"New latest DSM candidate: {name} (date {date})")
+
+    if latest is not None:
+        # Joined onto DSM_DIR, so the default "." yields a bare file name
+        latest = str(Path(dsm_dir) / latest)
     debug_print(f"Selected latest DSM file: {latest}")
     return latest
 
 
 def load_spreadsheet(path):
+    """Open a DSM workbook, reusing the open copy while the file is unchanged."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Let pandas raise its usual error for a missing/unreadable file
+        return _open_spreadsheet(path)
+    return _load_spreadsheet_cached(os.path.abspath(path), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_spreadsheet_cached(path, mtime_ns):
+    return _open_spreadsheet(path)
+
+
+def _open_spreadsheet(path):
+    import pandas as pd  # deferred: pandas dominates CLI start-up time
+
     debug_print(f"Loading spreadsheet: {path}")
     return CachedExcelFile(pd.ExcelFile(path))
 
@@ -126,25 +184,37 @@ def _time_execution(label, func, *args, **kwargs):
         debug_print(f"⏱️  {label} completed in {duration_ms:.2f} ms")
 
 
+@lru_cache(maxsize=64)
+def _column_map(columns):
+    """Map each stripped, upper-cased header in ``columns`` to the header."""
+    col_map = {}
+    for c in columns:
+        if isinstance(c, str):
+            col_map.setdefault(c.strip().upper(), c)
+    return col_map
+
+
+def _find_column(sheet_df, column_name):
+    """Return the header in ``sheet_df`` matching ``column_name``, or ``None``.
+
+    Headers are compared case-insensitively, ignoring surrounding whitespace.
+    """
+    return _column_map(tuple(sheet_df.columns)).get(column_name.upper())
+
+
 def get_column_value(sheet_df, excel_row, column_name):
+    import pandas as pd
+
     df_idx = excel_row
 
-    target_col = next(
-        (
-            c
-            for c in sheet_df.columns
-            if isinstance(c, str) and c.strip().upper() == column_name.upper()
-        ),
-        None,
-    )
+    target_col = _find_column(sheet_df, column_name)
 
     if not target_col:
         debug_print(f"Column '{column_name}' not found in sheet")
         return ""
 
     try:
-        row = sheet_df.iloc[df_idx]
-        value = row[target_col]
+        value = sheet_df[target_col].iat[df_idx]
         return str(value) if pd.notna(value) else ""
 
     except IndexError:
@@ -156,6 +226,10 @@ def get_column_value(sheet_df, excel_row, column_name):
         return ""
 
 
+# URLs inside an EXISTING URL cell, which may hold several
+_URL_FINDALL_RE = re.compile(r"https?://[^\s,;]+", re.IGNORECASE)
+
+
 def get_existing_urls(sheet_df, excel_row, col_name="EXISTING URL"):
     """Return all URLs found in the ``EXISTING URL`` cell.
 
@@ -180,24 +254,40 @@ def get_existing_urls(sheet_df, excel_row, col_name="EXISTING URL"):
         no URLs are present.
     """
 
-    raw_value = get_column_value(sheet_df, excel_row, col_name)
-    if not raw_value:
-        return []
+    # get_column_value already returns a string, "" for a blank cell
+    return _split_existing_urls(get_column_value(sheet_df, excel_row, col_name))
 
-    value = str(raw_value)
-    matches = re.findall(r"https?://[^\s,;]+", value, flags=re.IGNORECASE)
-    if matches:
-        return [m.strip() for m in matches]
 
+def _split_existing_urls(value):
+    """Return the URLs in the text of an existing-URL cell, as a list."""
     cleaned = value.strip()
-    return [cleaned] if cleaned else []
+    if not cleaned:
+        return []
+
+    # Most cells hold a single URL, which the regex would return unchanged
+    if (
+        cleaned[:8].lower().startswith(("http://", "https://"))
+        and "," not in cleaned
+        and ";" not in cleaned
+        and len(cleaned.split(None, 1)) == 1
+    ):
+        return [cleaned]
+
+    # The pattern stops at whitespace, so matches need no stripping
+    return _URL_FINDALL_RE.findall(value) or [cleaned]
 
 
 def get_existing_url(sheet_df, excel_row, col_name="EXISTING URL"):
     """Backward compatible wrapper returning the first existing URL."""
 
-    urls = get_existing_urls(sheet_df, excel_row, col_name)
-    return urls[0] if urls else ""
+    # Same first URL get_existing_urls would find, without collecting the rest
+    value = get_column_value(sheet_df, excel_row, col_name)
+    first = _URL_FINDALL_RE.search(value)
+    if first is None:
+        return value.strip()
+    if is_debug_enabled() and _URL_FINDALL_RE.search(value, first.end()):
+        debug_print("Multiple URLs found in cell, using first:", first[0])
+    return first[0]
 
 
 def get_proposed_url(sheet_df, excel_row, col_name="PROPOSED URL"):
@@ -205,28 +295,315 @@ def get_proposed_url(sheet_df, excel_row, col_name="PROPOSED URL"):
 
 
 def get_row_data(sheet_df, excel_row, columns=None):
+    import pandas as pd
+
     debug_print(f"Extracting row data from Excel row {excel_row}")
     if columns is None:
         columns = ["EXISTING URL", "PROPOSED URL"]
+
+    # Resolve every header up front and read the row once for all of them
+    resolved = {col.upper(): _find_column(sheet_df, col) for col in columns}
+    try:
+        row = sheet_df.iloc[excel_row]
+    except IndexError:
+        debug_print(f"Row index {excel_row} out of range")
+        row = None
+
     result = {}
-    for col in columns:
-        result[col.upper()] = get_column_value(sheet_df, excel_row, col)
+    for key, target_col in resolved.items():
+        if target_col is None or row is None:
+            result[key] = ""
+            continue
+        try:
+            value = row[target_col]
+            result[key] = str(value) if pd.notna(value) else ""
+        except Exception as e:
+            debug_print(f"Error retrieving {key}: {e}")
+            result[key] = ""
     debug_print(f"Extracted row data: {result}")
     return result
 
 
 def count_http(url):
     cnt = url.count("http")
-    debug_print(f"Counted {cnt} occurrences of 'http' in URL")
+    debug_print("Counted", cnt, "occurrences of 'http' in URL")
     return cnt
 
 
+# Extra worksheets searched by link lookups that aren't site domains
+_LOOKUP_BONUS_DOMAINS = (
+    MappingProxyType(
+        {
+            "full_name": "News Content",
+            "worksheet_name": "News Content",
+            "sitecore_domain_name": "none_defined",
+            "url": "example.com",
+            "worksheet_header_row": 0,
+        }
+    ),
+)
+
+# Every sheet a link lookup searches, in their default order
+_LOOKUP_DOMAINS = DOMAINS + _LOOKUP_BONUS_DOMAINS
+
+
+def _normalize_lookup_url(link_url):
+    """Drop the fragment and trailing slashes from ``link_url`` for lookups."""
+    parsed_url = urlparse(link_url)
+    # Reconstruct URL without fragment (anchor)
+    normalized_link = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+
+    if parsed_url.query:
+        normalized_link += f"?{parsed_url.query}"
+    # Remove trailing slash
+    return normalized_link.rstrip("/")
+
+
+def _lookup_columns(domain):
+    """Return the existing and proposed URL column names for a lookup sheet."""
+    if domain["full_name"].lower() == "news content":
+        return "Current URLs", "Path"
+    return (
+        domain.get("existing_url_col_name", "EXISTING URL"),
+        domain.get("proposed_url_col_name", "PROPOSED URL"),
+    )
+
+
+# Top-level domains that mark a proposed URL as a full URL rather than a path
+_PROPOSED_URL_TLDS = (".org", ".edu", ".com", ".gov", ".net")
+
+
+def _lookup_match(domain, excel_row, matched_url, proposed_url):
+    """Build the lookup result for a link found in ``domain`` at ``excel_row``."""
+    debug_print("Found match! Proposed URL:", proposed_url)
+
+    root = get_sitecore_root(matched_url)
+
+    # Strip domain from proposed URL if it contains a full URL
+    # Some DSM sheets have full URLs in the proposed column instead of just paths
+    # Check for TLDs since http(s):// may already be stripped
+    if proposed_url and any(tld in proposed_url for tld in _PROPOSED_URL_TLDS):
+        debug_print(
+            "Proposed URL appears to contain a domain, attempting to parse:",
+            proposed_url,
+        )
+        # If it doesn't start with a scheme, add one for parsing
+        url_to_parse = (
+            proposed_url
+            if proposed_url.startswith(("http://", "https://"))
+            else f"https://{proposed_url}"
+        )
+        parsed_proposed = urlparse(url_to_parse)
+        proposed_path = parsed_proposed.path
+        debug_print("Stripped domain from proposed URL, using path:", proposed_path)
+    else:
+        debug_print("Proposed URL is a path, using as-is:", proposed_url)
+        proposed_path = proposed_url
+
+    proposed_segments = (
+        [seg for seg in proposed_path.strip("/").split("/") if seg]
+        if proposed_path
+        else []
+    )
+
+    debug_print("Proposed hierarchy - root:", root, "segments:", proposed_segments)
+
+    return {
+        "found": True,
+        "domain": domain["full_name"],
+        "row": excel_row,
+        "existing_url": matched_url,
+        "proposed_url": proposed_url,
+        "proposed_hierarchy": {
+            "root": root,
+            "segments": proposed_segments,
+        },
+    }
+
+
+def _parse_lookup_sheet(excel_data, domain):
+    """Return the parsed worksheet searched for ``domain``'s links.
+
+    Workbooks from :func:`load_spreadsheet` memoise parsed sheets, so repeat
+    lookups reuse the DataFrame instead of re-reading the sheet.
+    """
+    return excel_data.parse(
+        domain.get("worksheet_name", domain["full_name"]),
+        header=domain.get("worksheet_header_row", 4),
+    )
+
+
+# Search order for links on each site hostname: that host's sheets first
+_LOOKUP_ORDER_BY_HOSTNAME = {
+    hostname: (*own, *(domain for domain in _LOOKUP_DOMAINS if domain not in own))
+    for hostname, own in DOMAINS_BY_HOSTNAME.items()
+}
+
+
+def _lookup_domain_order(link_url):
+    """Return the sheets to search for ``link_url``, most likely first.
+
+    Sheets for the link's own host come first, then the remaining site
+    domains and the extra lookup sheets, each in their usual order.
+    """
+    return _LOOKUP_ORDER_BY_HOSTNAME.get(urlparse(link_url).hostname, _LOOKUP_DOMAINS)
+
+
+def iter_dsm_rows(book, sheet_name, header_row, cols=("EXISTING URL", "PROPOSED URL")):
+    """Stream the ``cols`` cells of a worksheet in an open openpyxl ``book``.
+
+    Yields ``(excel_row, {col: value})`` for each row below ``header_row``,
+    numbered as in the DataFrame :meth:`CachedExcelFile.parse` would return.
+    Headers are matched as in :func:`get_column_value`; columns that aren't
+    found are left out, and nothing is yielded if none are.
+    """
+    sheet = book[sheet_name]
+    if getattr(sheet, "reset_dimensions", None):
+        # Read-only sheets may record stale dimensions; read them all as pandas does
+        sheet.reset_dimensions()
+
+    header = next(
+        sheet.iter_rows(
+            min_row=header_row + 1, max_row=header_row + 1, values_only=True
+        ),
+        (),
+    )
+    col_map = _column_map(tuple(header))
+    positions = {}
+    for name in cols:
+        column = col_map.get(name.upper())
+        if column is not None:
+            positions[name] = header.index(column)
+    if not positions:
+        return
+
+    first = min(positions.values())
+    last = max(positions.values())
+    rows = sheet.iter_rows(
+        min_row=header_row + 2, min_col=first + 1, max_col=last + 1, values_only=True
+    )
+    for excel_row, row in enumerate(rows):
+        yield excel_row, {
+            name: row[pos - first] if pos - first < len(row) else None
+            for name, pos in positions.items()
+        }
+
+
+def _openpyxl_book(excel_data):
+    """Return the open openpyxl workbook behind ``excel_data``, or ``None``."""
+    if not isinstance(excel_data, CachedExcelFile):
+        return None
+    book = getattr(excel_data._excel_file, "book", None)
+    return book if type(book).__module__.startswith("openpyxl") else None
+
+
+def _lookup_sheet_rows(excel_data, domain):
+    """Yield ``(excel_row, existing_text, proposed_text)`` for a lookup sheet.
+
+    Only rows with an existing-URL value are yielded. Workbooks opened with
+    openpyxl are streamed a row at a time, reading just the two URL columns;
+    anything else goes through a full sheet parse.
+    """
+    existing_name, proposed_name = _lookup_columns(domain)
+    sheet_name = domain.get("worksheet_name", domain["full_name"])
+    header_row = domain.get("worksheet_header_row", 4)
+
+    book = _openpyxl_book(excel_data)
+    if book is not None:
+        rows = iter_dsm_rows(
+            book, sheet_name, header_row, (existing_name, proposed_name)
+        )
+        for excel_row, cells in rows:
+            existing = cells.get(existing_name)
+            if existing is None or existing == "":
+                continue
+            proposed = cells.get(proposed_name)
+            yield excel_row, str(existing), "" if proposed is None else str(proposed)
+        return
+
+    import pandas as pd
+
+    df = _parse_lookup_sheet(excel_data, domain)
+    existing_col = _find_column(df, existing_name)
+    if existing_col is None:
+        return
+    proposed_col = _find_column(df, proposed_name)
+
+    # Read the columns once as arrays rather than a row at a time
+    cells = df[existing_col]
+    texts = cells.to_numpy(dtype=object)
+    proposed = df[proposed_col].to_numpy(dtype=object) if proposed_col else None
+    for excel_row in cells.notna().to_numpy().nonzero()[0].tolist():
+        value = proposed[excel_row] if proposed is not None else None
+        yield excel_row, str(texts[excel_row]), str(value) if pd.notna(value) else ""
+
+
+def build_dsm_index(excel_data):
+    """Index every existing URL in the DSM for constant-time link lookups.
+
+    Keys are the lower-cased whitespace-separated tokens of each existing URL
+    with one trailing slash dropped, so probing with a lower-cased normalized
+    link finds the cells :func:`lookup_link_in_dsm` would. Values map each
+    sheet's full name to ``(domain, excel_row, existing_url, proposed_url)``
+    for the first such cell in that sheet, in domain order.
+    """
+    index = {}
+    for domain in _LOOKUP_DOMAINS:
+        name = domain["full_name"]
+        try:
+            for excel_row, existing, proposed_url in _lookup_sheet_rows(
+                excel_data, domain
+            ):
+                for existing_url in _split_existing_urls(existing):
+                    for token in existing_url.lower().split():
+                        key = token[:-1] if token.endswith("/") else token
+                        matches = index.setdefault(key, {})
+                        if name not in matches:
+                            matches[name] = (
+                                domain,
+                                excel_row,
+                                existing_url,
+                                proposed_url,
+                            )
+        except Exception as e:
+            debug_print(f"Error indexing domain {domain}: {e}")
+            continue
+
+    debug_print(f"Indexed {len(index)} DSM URLs")
+    return index
+
+
+def _state_dsm_index(state):
+    """Return the DSM index for ``state.excel_data``, building it on first use."""
+    source, index = state._dsm_index or (None, None)
+    if source is not state.excel_data:
+        index = build_dsm_index(state.excel_data)
+        state._dsm_index = (state.excel_data, index)
+    return index
+
+
+def _indexed_lookup(index, link_url):
+    """Resolve ``link_url`` against a :func:`build_dsm_index` index."""
+    matches = index.get(_normalize_lookup_url(link_url).lower())
+    if not matches:
+        return {"found": False}
+    # Prefer a sheet for the link's own host, as the sheet scan does
+    own = DOMAINS_BY_HOSTNAME.get(urlparse(link_url).hostname, ())
+    entry = next(
+        (m for m in matches.values() if m[0] in own), next(iter(matches.values()))
+    )
+    return _lookup_match(*entry)
+
+
 def lookup_link_in_dsm(link_url, excel_data=None, state=None):
     """Locate a link's destination within the DSM spreadsheet.
 
     The function normalizes the supplied ``link_url`` and searches every
-    domain sheet for a matching entry. A regex pattern is used so the URL can
-    appear anywhere within the cell and optional trailing slashes are handled.
+    domain sheet for a matching entry, starting with the sheets for the
+    link's own host. The URL may appear anywhere within the cell as a
+    whitespace-separated token, ignoring case and one trailing slash.
+    Lookups against ``state.excel_data`` probe an index of the workbook built
+    once by :func:`build_dsm_index` instead of scanning the sheets.
 
     Args:
         link_url: URL to search for in the DSM.
@@ -240,7 +617,7 @@ def lookup_link_in_dsm(link_url, excel_data=None, state=None):
         ``existing_url``, ``proposed_url`` and ``proposed_hierarchy``. If no
         match is found ``{"found": False}`` is returned.
     """
-    debug_print(f"Looking up link in DSM: {link_url}")
+    debug_print("Looking up link in DSM:", link_url)
 
     if not excel_data and state:
         excel_data = state.excel_data
@@ -249,64 +626,50 @@ def lookup_link_in_dsm(link_url, excel_data=None, state=None):
         debug_print("No Excel data available for lookup")
         return {"found": False, "error": "No DSM data loaded"}
 
-    # Normalize the URL for comparison (remove trailing slashes and fragments/anchors)
-    parsed_url = urlparse(link_url)
-    # Reconstruct URL without fragment (anchor)
-    normalized_link = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+    # The state's workbook is indexed once and probed for every lookup after
+    if state is not None and excel_data is state.excel_data:
+        return _indexed_lookup(_state_dsm_index(state), link_url)
 
-    if parsed_url.query:
-        normalized_link += f"?{parsed_url.query}"
-    # Remove trailing slash
-    normalized_link = normalized_link.rstrip("/")
-
-    debug_print(f"Original link: {link_url}")
-    debug_print(f"Normalized link for lookup: {normalized_link}")
-
-    # Create a regex pattern to find the URL anywhere in the cell
-    # Escape special regex characters in the URL and allow for optional trailing slash
-    escaped_url = re.escape(normalized_link)
-    url_pattern = rf"(?:^|\s){escaped_url}/?(?:\s|$)"
+    # Normalize the URL for comparison (remove trailing slashes and fragments/anchors)
+    normalized_link = _normalize_lookup_url(link_url)
 
-    debug_print(f"🔎🔠 Using regex pattern for lookup: {url_pattern}")
+    debug_print("Original link:", link_url)
+    debug_print("Normalized link for lookup:", normalized_link)
 
-    bonus_domains = [
-        {
-            "full_name": "News Content",
-            "worksheet_name": "News Content",
-            "sitecore_domain_name": "none_defined",
-            "url": "example.com",
-            "worksheet_header_row": 0,
-        }
-    ]
+    lowered_link = normalized_link.lower()
+    # Tokens of a cell that count as the link
+    targets = (lowered_link, lowered_link + "/")
 
-    for domain in DOMAINS + bonus_domains:
+    for domain in _lookup_domain_order(link_url):
         try:
-            df = excel_data.parse(
-                domain.get("worksheet_name", domain["full_name"]),
-                header=domain.get("worksheet_header_row", 4),
-            )
+            df = _parse_lookup_sheet(excel_data, domain)
 
-            existing_url_col_name = domain.get("existing_url_col_name", "EXISTING URL")
-            proposed_url_col_name = domain.get("proposed_url_col_name", "PROPOSED URL")
+            existing_url_col_name, proposed_url_col_name = _lookup_columns(domain)
+            existing_col = _find_column(df, existing_url_col_name)
+            if existing_col is None:
+                continue
 
-            # Search through all rows in this domain
-            for idx in range(len(df)):
-                excel_row = idx
-                if domain["full_name"].lower() == "news content":
-                    existing_url_col_name = "Current URLs"
-                    proposed_url_col_name = "Path"
+            # A cell can only match if it contains the link, so find those rows
+            # with one vectorised scan and only inspect them individually
+            cells = df[existing_col]
+            texts = cells.astype(str)
+            candidates = cells.notna() & texts.str.contains(
+                normalized_link, case=False, regex=False
+            )
+            texts = texts.to_numpy()
 
-                existing_urls = get_existing_urls(df, excel_row, existing_url_col_name)
+            for excel_row in candidates.to_numpy().nonzero()[0].tolist():
+                existing_urls = _split_existing_urls(texts[excel_row])
 
                 if not existing_urls:
                     continue
 
-                # Use regex to check if the target URL exists anywhere in the cell
+                # Compare the link against each whitespace-separated token
                 matched_url = next(
                     (
                         u
                         for u in existing_urls
-                        if re.search(url_pattern, u, re.IGNORECASE)
+                        if any(token in targets for token in u.lower().split())
                     ),
                     None,
                 )
@@ -315,64 +678,7 @@ def lookup_link_in_dsm(link_url, excel_data=None, state=None):
                     proposed_url = get_proposed_url(
                         df, excel_row, proposed_url_col_name
                     )
-                    debug_print(f"Found match! Proposed URL: {proposed_url}")
-
-                    # Generate the proposed hierarchy using existing functions
-                    try:
-                        from utils.sitecore import get_sitecore_root
-
-                        root = get_sitecore_root(matched_url)
-                    except ImportError:
-                        root = "Sites"  # Default fallback
-
-                    # Strip domain from proposed URL if it contains a full URL
-                    # Some DSM sheets have full URLs in the proposed column instead of just paths
-                    # Check for TLDs since http(s):// may already be stripped
-                    if proposed_url and any(
-                        tld in proposed_url
-                        for tld in [".org", ".edu", ".com", ".gov", ".net"]
-                    ):
-                        debug_print(
-                            f"Proposed URL appears to contain a domain, attempting to parse: {proposed_url}"
-                        )
-                        # If it doesn't start with a scheme, add one for parsing
-                        url_to_parse = (
-                            proposed_url
-                            if proposed_url.startswith(("http://", "https://"))
-                            else f"https://{proposed_url}"
-                        )
-                        parsed_proposed = urlparse(url_to_parse)
-                        proposed_path = parsed_proposed.path
-                        debug_print(
-                            f"Stripped domain from proposed URL, using path: {proposed_path}"
-                        )
-                    else:
-                        debug_print(
-                            f"Proposed URL is a path, using as-is: {proposed_url}"
-                        )
-                        proposed_path = proposed_url
-
-                    proposed_segments = (
-                        [seg for seg in proposed_path.strip("/").split("/") if seg]
-                        if proposed_path
-                        else []
-                    )
-
-                    debug_print(
-                        f"Proposed hierarchy - root: {root}, segments: {proposed_segments}"
-                    )
-
-                    return {
-                        "found": True,
-                        "domain": domain["full_name"],
-                        "row": excel_row,
-                        "existing_url": matched_url,
-                        "proposed_url": proposed_url,
-                        "proposed_hierarchy": {
-                            "root": root,
-                            "segments": proposed_segments,
-                        },
-                    }
+                    return _lookup_match(domain, excel_row, matched_url, proposed_url)
 
         except Exception as e:
             debug_print(f"Error searching domain {domain}: {e}")
@@ -380,3 +686,42 @@ def lookup_link_in_dsm(link_url, excel_data=None, state=None):
 
     debug_print("Link not found in any domain")
     return {"found": False}
+
+
+def lookup_links_in_dsm(link_urls, excel_data=None, state=None):
+    """Look up several links in the DSM with a single pass over the sheets.
+
+    Matches the same cells as :func:`lookup_link_in_dsm`: a link is found
+    when it appears as a whitespace-separated token of an existing URL, with
+    an optional trailing slash, ignoring case. Each link resolves to its
+    first match in row order, searching its own host's sheets first.
+
+    Args:
+        link_urls: URLs to search for in the DSM.
+        excel_data: Pre-loaded Excel data; ``state.excel_data`` is used when
+            this argument is ``None``.
+        state: State object providing ``excel_data`` when ``excel_data`` is not
+            supplied.
+
+    Returns:
+        dict: Maps each URL in ``link_urls`` to the result
+        :func:`lookup_link_in_dsm` would return for it.
+    """
+    link_urls = list(dict.fromkeys(link_urls))
+    debug_print(f"Looking up {len(link_urls)} links in DSM")
+
+    if not excel_data and state:
+        excel_data = state.excel_data
+
+    if not excel_data:
+        debug_print("No Excel data available for lookup")
+        return {
+            url: {"found": False, "error": "No DSM data loaded"} for url in link_urls
+        }
+
+    # Index the sheets once, reusing the state's index for its own workbook
+    if state is not None and excel_data is state.excel_data:
+        index = _state_dsm_index(state)
+    else:
+        index = build_dsm_index(excel_data)
+    return {url: _indexed_lookup(index, url) for url in link_urls}
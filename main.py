@@ -1,7 +1,7 @@
 import argparse
 import warnings
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import atexit
 
 from constants import get_commands
@@ -11,12 +11,6 @@ from data.dsm import (
     get_latest_dsm_file,
     load_spreadsheet,
 )
-from utils.scraping import (
-    check_status_code,
-)
-import requests
-from bs4 import BeautifulSoup
-
 from utils.core import debug_print, sync_debug_with_state, set_debug
 from utils.history import get_history, cleanup_history
 
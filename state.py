@@ -3,6 +3,7 @@ State management for Linker CLI.
 """
 
 import re
+from collections import OrderedDict
 from utils.core import debug_print
 
 
@@ -29,6 +30,19 @@ class CLIState:
         self.excel_data = None
         self.current_page_data = None
 
+        # Memoised (key, result) of the last cache validation
+        self._cache_validity = None
+        # Memoised (key, result) of the last cache file lookup
+        self._last_cache_lookup = None
+        # (workbook, {(worksheet, row): values}) memo of DSM row reads
+        self._dsm_row_cache = None
+        # (workbook, index) built by data.dsm.build_dsm_index for link lookups
+        self._dsm_index = None
+        # Captured report sections keyed by report context
+        self._report_fragments = OrderedDict()
+        # Command name -> handler mapping built by constants.get_commands
+        self._commands = None
+
         # Variables that should be returned as booleans
         self.boolean_variables = {"INCLUDE_SIDEBAR", "DEBUG"}
 
@@ -16,6 +16,7 @@ from commands import load as load_cmd
 from commands import report as report_cmd
 from commands import bulk as bulk_cmd
 from commands import check as check_cmd
+from commands import dsm as dsm_cmd
 from utils import core as utils
 from utils import cache as cache_utils
 from utils import validation as validation_utils
@@ -91,6 +92,40 @@ def test_cmd_open_report_not_found(monkeypatch, mock_state, capsys):
     assert "Generate a report first" in out
 
 
+def test_open_files_batches_on_macos(monkeypatch):
+    run = MagicMock()
+    monkeypatch.setattr(commands, "_SYSTEM", "Darwin")
+    monkeypatch.setattr(commands.subprocess, "run", run)
+    assert commands._open_files_in_default_app(["a.html", "b.html"]) == []
+    run.assert_called_once()
+    assert run.call_args.args[0][0] == "open"
+    assert len(run.call_args.args[0]) == 3
+
+
+def test_open_files_reports_failures_per_file(monkeypatch):
+    error = OSError("boom")
+    opener = MagicMock(side_effect=[error, None])
+    monkeypatch.setattr(commands, "_SYSTEM", "Linux")
+    monkeypatch.setattr(commands, "_open_file_in_default_app", opener)
+    assert commands._open_files_in_default_app(["a.html", "b.html"]) == [
+        ("a.html", error)
+    ]
+    assert opener.call_count == 2
+
+
+def test_open_url_unsupported_platform(monkeypatch):
+    monkeypatch.setattr(commands, "_SYSTEM", "Plan9")
+    with pytest.raises(OSError, match="Unsupported operating system: Plan9"):
+        commands._open_url_in_browser("http://example.com")
+
+
+def test_clean_domain_name_matches_regex():
+    for domain in ["Enterprise", "medicine.musc.edu", "Children's Health", "Café-Ü"]:
+        assert commands._clean_domain_name(domain) == commands._DOMAIN_CLEAN_RE.sub(
+            "_", domain.lower()
+        )
+
+
 # ----- cmd_clear test -----
 
 
@@ -125,8 +160,151 @@ def test_cmd_bulk_check_all_done(tmp_path, monkeypatch, cli_state, capsys):
     assert "already been processed" in capsys.readouterr().out
 
 
+def test_bulk_check_template_has_no_pending_rows(tmp_path):
+    xlsx = tmp_path / "bulk.xlsx"
+    bulk_cmd._create_bulk_check_template(xlsx)
+    assert xlsx.exists()
+    assert bulk_cmd._load_bulk_check_xlsx(xlsx) == []
+
+
+def test_load_bulk_check_xlsx_skips_comments_and_completed_rows(tmp_path):
+    import pandas as pd
+
+    xlsx = tmp_path / "bulk.xlsx"
+    pd.DataFrame(
+        {
+            "kanban_id": ["'abc123", "# comment", "", "def"],
+            "title": ["Surgery", "", "", "Done"],
+            "domain": ["COM", "# note", "CON", "COM"],
+            "row": [12.0, 3, None, 14],
+            "existing_url": ["", "", "", "http://x"],
+            "no_links": ["", "", "", 3],
+            "no_pdfs": ["", "", "", 0],
+            "no_embeds": ["", "", "", 1],
+            "% difficulty": ["", "", "", 0.5],
+        }
+    ).to_excel(xlsx, index=False)
+
+    assert bulk_cmd._load_bulk_check_xlsx(xlsx) == [
+        {"kanban_id": "abc123", "title": "Surgery", "domain": "COM", "row": 12}
+    ]
+
+
+def test_bulk_update_log_is_compacted_into_workbook(tmp_path):
+    import pandas as pd
+
+    xlsx = tmp_path / "bulk.xlsx"
+    pd.DataFrame(
+        {"kanban_id": ["a", "b"], "domain": ["COM", "CON"], "row": [12, 14]}
+    ).to_excel(xlsx, index=False)
+
+    with open(bulk_cmd._bulk_log_path(xlsx), "a", encoding="utf-8") as log:
+        bulk_cmd._append_bulk_update(log, "com", 12.0, "http://old", 9, 9, 9, 0.0)
+        bulk_cmd._append_bulk_update(log, "com", 12.0, "http://x", 3, 1, 0, 0.5)
+        bulk_cmd._append_bulk_update(log, "CDM", 99, "http://y", 1, 1, 1, 1.0)
+        log.write('{"key": "con|14", "val')  # truncated by an interrupted run
+
+    unmatched = bulk_cmd._compact_bulk_check_xlsx(xlsx)
+
+    assert unmatched == ["cdm|99"]
+    assert not bulk_cmd._bulk_log_path(xlsx).exists()
+    df = pd.read_excel(xlsx)
+    assert df.loc[0, "existing_url"] == "http://x"
+    assert df.loc[0, "no_links"] == 3
+    assert [r["domain"] for r in bulk_cmd._load_bulk_check_xlsx(xlsx)] == ["CON"]
+
+
+def test_calculate_difficulty_percentage_counts_easy_links():
+    links = [
+        ("Call", "tel:123", 0),
+        ("Mail", "mailto:a@b.c", 0),
+        ("Page", "https://example.com", 200),
+        ("Odd",),
+    ]
+    assert bulk_cmd._calculate_difficulty_percentage(links) == 0.5
+    assert bulk_cmd._calculate_difficulty_percentage([]) == 0.0
+
+
+def test_bulk_run_reads_workbook_once(tmp_path, monkeypatch):
+    import pandas as pd
+
+    xlsx = tmp_path / "bulk.xlsx"
+    pd.DataFrame({"domain": ["COM"], "row": [12]}).to_excel(xlsx, index=False)
+    reader = MagicMock(wraps=pd.read_excel)
+    monkeypatch.setattr(bulk_cmd.pd, "read_excel", reader)
+
+    assert len(bulk_cmd._load_bulk_check_xlsx(xlsx)) == 1
+    with open(bulk_cmd._bulk_log_path(xlsx), "a", encoding="utf-8") as log:
+        bulk_cmd._append_bulk_update(log, "COM", 12, "http://x", 1, 0, 0, 1.0)
+    assert bulk_cmd._compact_bulk_check_xlsx(xlsx) == []
+    assert reader.call_count == 1
+
+    assert bulk_cmd._load_bulk_check_xlsx(xlsx) == []
+    assert reader.call_count == 2
+
+
+def test_process_bulk_rows_fetches_and_logs_each_row(tmp_path, monkeypatch, cli_state):
+    import io
+    import json
+
+    monkeypatch.setattr(cache_utils, "CACHE_DIR", tmp_path)
+
+    def fake_load(args, state):
+        state.set_variable("URL", f"http://example.com/{args[1]}")
+        state.set_variable("DOMAIN", args[0])
+        state.set_variable("ROW", args[1])
+
+    fetch = MagicMock(
+        side_effect=lambda urls, *_: (
+            {"links": [("a", "mailto:x", 0)] * len(urls)},
+            [],
+        )
+    )
+    cached = []
+    monkeypatch.setattr(bulk_cmd, "cmd_load", fake_load)
+    monkeypatch.setattr(bulk_cmd, "_fetch_page_data", fetch)
+    monkeypatch.setattr(
+        bulk_cmd,
+        "_cache_page_data",
+        lambda state, url, data, compact: cached.append(
+            (state.get_variable("ROW"), url, compact)
+        ),
+    )
+
+    rows = [
+        {"kanban_id": "k1", "domain": "COM", "row": 1},
+        {"kanban_id": "k2", "domain": "COM", "row": 2},
+    ]
+    log = io.StringIO()
+    assert bulk_cmd._process_bulk_rows(rows, cli_state, log) == 2
+    assert fetch.call_count == 2
+    assert sorted(cached) == [
+        ("1", "http://example.com/1", True),
+        ("2", "http://example.com/2", True),
+    ]
+    entries = sorted(json.loads(line)["key"] for line in log.getvalue().splitlines())
+    assert entries == ["com|1", "com|2"]
+
+
 # ----- cmd_check tests -----
 
+
+def test_fetch_page_data_returns_failures_without_printing(monkeypatch, capsys):
+    pages = {
+        "http://a": {"links": [("a", "http://a/1", "200")], "meta_robots": "x"},
+        "http://b": {"error": "boom"},
+    }
+    monkeypatch.setattr(check_cmd, "retrieve_page_data", lambda u, *_: pages[u])
+
+    combined, errors = check_cmd._fetch_page_data(["http://a", "http://b"], "#main", 0)
+    assert combined["links"] == [("a", "http://a/1", "200")]
+    assert errors == [("http://b", "boom")]
+    assert capsys.readouterr().out == ""
+
+    check_cmd._report_fetch_errors(errors)
+    assert "Failed to extract data for http://b: boom" in capsys.readouterr().out
+
+
 # ----- cmd_debug tests -----
 
 
@@ -154,6 +332,48 @@ def test_cmd_help_output(cli_state, capsys):
     assert "COMMAND REFERENCE" in capsys.readouterr().out
 
 
+def test_get_commands_reuses_mapping_per_state(cli_state):
+    from constants import get_commands
+    from state import CLIState
+
+    commands_map = get_commands(cli_state)
+    assert get_commands(cli_state) is commands_map
+    assert get_commands(CLIState()) is not commands_map
+
+
+def test_get_commands_does_not_keep_state_alive():
+    import gc
+    import weakref
+
+    from constants import get_commands
+    from state import CLIState
+
+    state = CLIState()
+    get_commands(state)
+    ref = weakref.ref(state)
+    del state
+    gc.collect()
+    assert ref() is None
+
+
+def test_get_commands_dispatches_with_state(cli_state, capsys):
+    from constants import get_commands
+
+    commands_map = get_commands(cli_state)
+    commands_map["vars"](["ignored"])
+    assert "CURRENT VARIABLES" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        commands_map["q"]([])
+
+
+def test_command_handlers_resolve_once_on_first_use():
+    from constants import _command_handler
+
+    handler = _command_handler("commands.core", "cmd_show")
+    assert handler is commands.cmd_show
+    assert _command_handler("commands.core", "cmd_show") is handler
+
+
 # ----- cmd_links test -----
 
 
@@ -169,6 +389,57 @@ def test_cmd_links(monkeypatch, cli_state):
     func.assert_called_once_with(cli_state)
 
 
+def test_links_analysis_matches_hosts_of_path_domains(monkeypatch, cli_state, capsys):
+    from constants import INTERNAL_HOSTNAMES
+
+    assert "web.musc.edu" in INTERNAL_HOSTNAMES
+    assert not any("/" in host for host in INTERNAL_HOSTNAMES)
+
+    monkeypatch.setattr(
+        "data.dsm.lookup_links_in_dsm",
+        lambda urls, *a, **k: {url: {"found": False} for url in urls},
+    )
+    cli_state.current_page_data = {
+        "links": [
+            ("News", "https://web.musc.edu/about/news", "200"),
+            ("Other", "https://example.com/", "200"),
+        ]
+    }
+    utils.output_internal_links_analysis_detail(cli_state)
+    assert "Found 1 internal links" in capsys.readouterr().out
+
+
+def test_links_analysis_looks_up_links_in_one_batch(monkeypatch, cli_state, capsys):
+    lookup = MagicMock(
+        return_value={
+            "https://web.musc.edu/a": {"found": False},
+            "https://web.musc.edu/b": {"found": False},
+        }
+    )
+    monkeypatch.setattr("data.dsm.lookup_links_in_dsm", lookup)
+    cli_state.current_page_data = {
+        "links": [
+            ("A", "https://web.musc.edu/a", "200"),
+            ("B", "https://web.musc.edu/b", "200"),
+        ],
+        "pdfs": [("A again", "https://web.musc.edu/a", "200")],
+    }
+    utils.output_internal_links_analysis_detail(cli_state)
+    lookup.assert_called_once()
+    assert capsys.readouterr().out.count("Not found in DSM") == 3
+
+
+def test_display_page_data_writes_to_given_file(capsys):
+    from io import StringIO
+
+    buf = StringIO()
+    utils.display_page_data(
+        {"url": "https://x", "links": [("A", "h", "200")]}, file=buf
+    )
+    assert "EXTRACTED PAGE DATA" in buf.getvalue()
+    assert capsys.readouterr().out == ""
+
+
 # ----- cmd_load test -----
 
 
@@ -197,6 +468,26 @@ def test_cmd_load_success(monkeypatch, cli_state, capsys):
     assert "Loaded URL" in capsys.readouterr().out
 
 
+def test_load_reuses_dsm_row_until_workbook_changes(monkeypatch, cli_state):
+    cli_state.excel_data = MagicMock()
+    cli_state.excel_data.parse.return_value.columns = ["EXISTING URL"]
+    monkeypatch.setattr(
+        load_cmd, "get_existing_urls", lambda df, row, col_name: ["http://page"]
+    )
+    monkeypatch.setattr(load_cmd, "get_proposed_url", lambda df, row, col_name: "/new")
+    monkeypatch.setattr(load_cmd, "_update_state_from_cache", MagicMock())
+
+    load_cmd.cmd_load(["Enterprise", "5"], cli_state)
+    load_cmd.cmd_load(["Enterprise", "5"], cli_state)
+    assert cli_state.excel_data.parse.call_count == 1
+    assert cli_state.get_variable("URL") == "http://page"
+
+    cli_state.excel_data = MagicMock()
+    cli_state.excel_data.parse.return_value.columns = ["EXISTING URL"]
+    load_cmd.cmd_load(["Enterprise", "5"], cli_state)
+    assert cli_state.excel_data.parse.call_count == 1
+
+
 def test_cmd_load_invalid_args(monkeypatch, cli_state, capsys):
     """Ensure validation wrapper prevents execution with bad args."""
     cli_state.excel_data = MagicMock()
@@ -215,16 +506,88 @@ def test_cmd_report_multiple_rows(monkeypatch, cli_state):
     load = MagicMock()
     gen = MagicMock(return_value="file.html")
     opener = MagicMock()
-    monkeypatch.setattr(report_cmd, "cmd_load", load)
+    monkeypatch.setattr(report_cmd, "load_row", load)
+    sync = MagicMock()
     monkeypatch.setattr(report_cmd, "_generate_report", gen)
+    monkeypatch.setattr(report_cmd, "_sync_report_static_assets", sync)
     monkeypatch.setattr(commands, "_open_file_in_default_app", opener)
     monkeypatch.setattr("builtins.input", lambda _: "n")
     report_cmd.cmd_report(["Enterprise", "1", "2"], cli_state)
     assert load.call_count == 2
     assert gen.call_count == 2
+    assert all(c.kwargs["sync_assets"] is False for c in gen.call_args_list)
+    sync.assert_called_once()
     opener.assert_not_called()
 
 
+def test_cmd_report_prefetches_uncached_rows(monkeypatch, cli_state):
+    def fake_load(state, domain, row):
+        state.set_variable("URL", f"http://example.com/{row}")
+        state.current_page_data = None
+        return [state.get_variable("URL")]
+
+    fetch = MagicMock(
+        side_effect=lambda urls, *_: ({"links": [("a", urls[0], 200)]}, [])
+    )
+    cache = MagicMock()
+    seen = []
+    monkeypatch.setattr(report_cmd, "load_row", fake_load)
+    monkeypatch.setattr(report_cmd, "_fetch_page_data", fetch)
+    monkeypatch.setattr(report_cmd, "_cache_page_data", cache)
+    monkeypatch.setattr(
+        report_cmd,
+        "_generate_report",
+        lambda state, **_: seen.append(
+            (state.get_variable("URL"), state.current_page_data["links"][0][1])
+        ),
+    )
+    report_cmd.cmd_report(["Enterprise", "1", "2"], cli_state)
+    assert fetch.call_count == 2
+    assert cache.call_count == 2
+    assert seen == [
+        ("http://example.com/1", "http://example.com/1"),
+        ("http://example.com/2", "http://example.com/2"),
+    ]
+
+
+def test_cmd_report_generates_many_rows_on_the_shared_state(monkeypatch, cli_state):
+    def fake_load(state, domain, row):
+        state.set_variable("ROW", row)
+        state.current_page_data = {"links": []}
+        return ["http://example.com"]
+
+    states = []
+
+    def fake_generate(state, **_):
+        states.append(state)
+        return f"{state.get_variable('ROW')}.html"
+
+    monkeypatch.setattr(report_cmd, "load_row", fake_load)
+    monkeypatch.setattr(
+        report_cmd, "_is_cache_valid_for_context", lambda *_: (True, "")
+    )
+    monkeypatch.setattr(report_cmd, "_generate_report", fake_generate)
+    monkeypatch.setattr(report_cmd, "_sync_report_static_assets", MagicMock())
+    opener = MagicMock(return_value=[])
+    monkeypatch.setattr(report_cmd, "_open_files_in_default_app", opener)
+    monkeypatch.setattr("builtins.input", lambda _: "y")
+
+    cli_state.set_variable("DSM_FILE", "dsm-test.xlsx")
+    report_cmd.cmd_report(["Enterprise", "1", "2", "3", "4"], cli_state)
+
+    # Every report reuses the CLI state, and with it the DSM index it holds
+    assert all(state is cli_state for state in states)
+    opener.assert_called_once_with(["1.html", "2.html", "3.html", "4.html"])
+
+
+def test_cmd_report_unknown_domain(monkeypatch, cli_state, capsys):
+    load = MagicMock()
+    monkeypatch.setattr(report_cmd, "load_row", load)
+    report_cmd.cmd_report(["Nowhere", "1"], cli_state)
+    load.assert_not_called()
+    assert "Domain 'Nowhere' not found" in capsys.readouterr().out
+
+
 # ----- cmd_set test -----
 
 
@@ -238,6 +601,22 @@ def test_cmd_set_url(monkeypatch, mock_state, capsys):
     assert "URL => http://example.com" in capsys.readouterr().out
 
 
+def test_cmd_set_same_dsm_file_reuses_workbook(tmp_path, monkeypatch, cli_state):
+    import pandas as pd
+
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({"A": [1]}).to_excel("dsm-0101.xlsx", index=False)
+    opener = MagicMock(wraps=pd.ExcelFile)
+    monkeypatch.setattr(pd, "ExcelFile", opener)
+
+    commands.cmd_set(["DSM_FILE", "dsm-0101.xlsx"], cli_state)
+    first = cli_state.excel_data
+    commands.cmd_set(["DSM_FILE", "dsm-0101.xlsx"], cli_state)
+
+    assert cli_state.excel_data is first
+    assert opener.call_count == 1
+
+
 # ----- cmd_show tests -----
 
 
@@ -568,3 +947,221 @@ def test_validate_load_args_unknown_domain():
 def test_validate_load_args_missing_args():
     with pytest.raises(ValueError, match="Expected: load <domain> <row>"):
         validation_utils.validate_load_args([])
+
+
+def test_validate_load_args_matches_alias_case_insensitively():
+    domain, row = validation_utils.validate_load_args(["hcc", "7"])
+    assert domain.get("full_name") == "Hollings Cancer"
+    assert row == 7
+
+
+# ----- cache utils tests -----
+
+
+def _write_cache_file(path, url="http://example.com", domain="COM", row="5"):
+    import json
+
+    metadata = {
+        "url": url,
+        "domain": domain,
+        "row": row,
+        "kanban_id": "",
+        "selector": "#main",
+        "include_sidebar": False,
+        "timestamp": "2025-01-01T00:00:00",
+        "cache_filename": path.name,
+    }
+    page_data = {"links": [], "meta_description": "", "meta_robots": ""}
+    path.write_text(json.dumps({"metadata": metadata, "page_data": page_data}))
+
+
+def test_cache_validity_is_memoised_until_file_changes(
+    tmp_path, monkeypatch, cli_state
+):
+    cache_file = tmp_path / "page_check_COM-5.json"
+    _write_cache_file(cache_file)
+    cli_state.set_variable("URL", "http://example.com")
+    cli_state.set_variable("DOMAIN", "COM")
+    cli_state.set_variable("ROW", "5")
+
+    loader = MagicMock(wraps=cache_utils._load_cached_page_data)
+    monkeypatch.setattr(cache_utils, "_load_cached_page_data", loader)
+
+    assert cache_utils._is_cache_valid_for_context(cli_state, str(cache_file))[0]
+    assert cache_utils._is_cache_valid_for_context(cli_state, str(cache_file))[0]
+    assert loader.call_count == 1
+
+    _write_cache_file(cache_file, url="http://other.com")
+    os.utime(cache_file, ns=(0, cache_file.stat().st_mtime_ns + 1_000_000))
+    is_valid, reason = cache_utils._is_cache_valid_for_context(
+        cli_state, str(cache_file)
+    )
+    assert not is_valid
+    assert "URL mismatch" in reason
+    assert loader.call_count == 2
+
+
+def test_cache_page_data_resets_cache_validity(tmp_path, monkeypatch, cli_state):
+    monkeypatch.setattr(cache_utils, "CACHE_DIR", tmp_path)
+    cli_state.set_variable("URL", "http://example.com")
+    cli_state.set_variable("DOMAIN", "COM")
+    cli_state.set_variable("ROW", "5")
+    data = {"links": [], "meta_description": "", "meta_robots": ""}
+
+    cache_utils._cache_page_data(cli_state, "http://example.com", {"links": []})
+    cache_file = cli_state.get_variable("CACHE_FILE")
+    assert not cache_utils._is_cache_valid_for_context(cli_state, cache_file)[0]
+
+    # Rewritten within the same mtime tick, the file must still be re-read
+    mtime_ns = os.stat(cache_file).st_mtime_ns
+    cache_utils._cache_page_data(cli_state, "http://example.com", data)
+    os.utime(cache_file, ns=(mtime_ns, mtime_ns))
+    assert cache_utils._is_cache_valid_for_context(cli_state, cache_file)[0]
+
+
+def test_update_state_from_cache_reuses_lookup(tmp_path, monkeypatch, cli_state):
+    monkeypatch.setattr(cache_utils, "CACHE_DIR", tmp_path)
+    _write_cache_file(tmp_path / "page_check_COM-5.json")
+
+    loader = MagicMock(wraps=cache_utils._load_cached_page_data)
+    monkeypatch.setattr(cache_utils, "_load_cached_page_data", loader)
+
+    for _ in range(2):
+        cli_state.reset_page_context_state()
+        cache_utils._update_state_from_cache(
+            cli_state, url="http://example.com", domain="COM", row="5"
+        )
+        assert cli_state.get_variable("URL") == "http://example.com"
+        assert cli_state.current_page_data["links"] == []
+
+    assert loader.call_count == 1
+
+
+def test_cache_page_data_compact_round_trips(tmp_path, monkeypatch, cli_state):
+    monkeypatch.setattr(cache_utils, "CACHE_DIR", tmp_path)
+    cli_state.set_variable("DOMAIN", "COM")
+    cli_state.set_variable("ROW", "5")
+    data = {"links": [["a", "http://example.com/a", 200]]}
+
+    cache_utils._cache_page_data(cli_state, "http://example.com", data, compact=True)
+
+    cache_file = Path(cli_state.get_variable("CACHE_FILE"))
+    assert "\n" not in cache_file.read_text(encoding="utf-8")
+    _, page_data = cache_utils._load_cached_page_data(cache_file)
+    assert page_data == data
+
+
+def test_cache_reusable_for_same_url_on_another_row(tmp_path, monkeypatch, cli_state):
+    monkeypatch.setattr(cache_utils, "CACHE_DIR", tmp_path)
+    cache_file = tmp_path / "page_check_COM-5.json"
+    _write_cache_file(cache_file)
+    # This row's own cache file is stale: it was fetched from another URL
+    _write_cache_file(tmp_path / "page_check_COM-6.json", url="http://old.com", row="6")
+    cli_state.set_variable("URL", "http://example.com")
+    cli_state.set_variable("DOMAIN", "COM")
+    cli_state.set_variable("ROW", "6")
+    cli_state.set_variable("SELECTOR", "#main")
+
+    assert not cache_utils._is_cache_valid_for_context(cli_state, str(cache_file))[0]
+    page_data = cache_utils._find_reusable_page_data_for_url(cli_state)
+    assert page_data == {"links": [], "meta_description": "", "meta_robots": ""}
+
+    cli_state.set_variable("SELECTOR", "#content")
+    assert cache_utils._find_reusable_page_data_for_url(cli_state) is None
+
+
+def test_cached_page_checks_match_across_validators(cli_state):
+    metadata = {
+        "url": "http://example.com",
+        "domain": "COM",
+        "row": "5",
+        "kanban_id": "",
+        "selector": "#main",
+        "include_sidebar": False,
+        "timestamp": "",
+        "cache_filename": "",
+    }
+    page_data = {"links": []}
+    cli_state.set_variable("URL", "http://example.com")
+    cli_state.set_variable("ROW", "6")
+
+    is_valid, reason = cache_utils._check_cached_page(
+        cli_state, metadata, page_data, ignore_domain_row=True
+    )
+    assert not is_valid
+    assert "meta description" in reason
+
+    page_data.update(meta_description="", meta_robots="")
+    assert not cache_utils._check_cached_page(cli_state, metadata, page_data)[0]
+    assert cache_utils._check_cached_page(
+        cli_state, metadata, page_data, ignore_domain_row=True
+    )[0]
+
+
+# ----- cmd_profile test -----
+
+
+def test_cmd_profile_runs_script_in_process(monkeypatch, cli_state, capsys):
+    from commands import profile as profile_cmd
+    from update_provider_profile_urls import update_provider_profile_urls as script
+
+    main = MagicMock(side_effect=FileNotFoundError("before.html not found"))
+    monkeypatch.setattr(script, "main", main)
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent)
+    profile_cmd.cmd_profile([], cli_state)
+    main.assert_called_once_with()
+    assert "Failed to run script: before.html not found" in capsys.readouterr().out
+
+
+# ----- cmd_dsm test -----
+
+
+def test_cmd_dsm_prints_aligned_columns(cli_state, capsys):
+    import pandas as pd
+
+    cli_state.set_variable("DOMAIN", "Enterprise")
+    cli_state.set_variable("ROW", "5")
+    cli_state.excel_data = MagicMock()
+    from constants import DOMAINS_BY_NAME, dsm_row_offset
+
+    offset = dsm_row_offset(DOMAINS_BY_NAME["enterprise"])
+    df = pd.DataFrame({"URL": [None] * 5, "Page Title": [None] * 5})
+    df.loc[5 - offset] = ["http://example.com", "Home"]
+    cli_state.excel_data.parse.return_value = df
+
+    dsm_cmd.cmd_dsm([], cli_state)
+
+    out = capsys.readouterr().out.splitlines()
+    assert "Column      Value" in out
+    assert "URL         http://example.com" in out
+    assert "Page Title  Home" in out
+
+
+def test_cmd_dsm_reuses_sheet_parsed_by_load(monkeypatch, cli_state, capsys):
+    import pandas as pd
+    from data.dsm import CachedExcelFile
+
+    workbook = MagicMock()
+    workbook.parse.return_value = pd.DataFrame(
+        {"EXISTING URL": ["http://example.com"] * 10}
+    )
+    cli_state.excel_data = CachedExcelFile(workbook)
+    monkeypatch.setattr(load_cmd, "_update_state_from_cache", MagicMock())
+
+    load_cmd.cmd_load(["Enterprise", "8"], cli_state)
+    dsm_cmd.cmd_dsm([], cli_state)
+
+    assert workbook.parse.call_count == 1
+    assert "EXISTING URL  http://example.com" in capsys.readouterr().out
+
+
+def test_cmd_profile_reports_import_failure(monkeypatch, cli_state, capsys):
+    import sys
+    from commands import profile as profile_cmd
+
+    monkeypatch.setitem(
+        sys.modules, "update_provider_profile_urls.update_provider_profile_urls", None
+    )
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent)
+    profile_cmd.cmd_profile([], cli_state)
+    assert "Failed to run script:" in capsys.readouterr().out
@@ -21,3 +21,296 @@ def test_get_existing_urls_handles_commas_and_semicolons():
 def test_get_existing_url_wrapper_returns_first():
     df = pd.DataFrame({"EXISTING URL": ["http://one.com http://two.com"]})
     assert dsm.get_existing_url(df, 0) == "http://one.com"
+
+
+def test_get_existing_url_matches_first_of_all_urls():
+    cells = [
+        "  http://one.com  ",
+        "see: http://one.com;http://two.com",
+        "not a url ",
+        "",
+        None,
+    ]
+    df = pd.DataFrame({"EXISTING URL": cells})
+    for row in range(len(cells)):
+        urls = dsm.get_existing_urls(df, row)
+        assert dsm.get_existing_url(df, row) == (urls[0] if urls else "")
+
+
+def test_get_column_value_matches_headers_loosely():
+    df = pd.DataFrame({" Proposed Url ": ["/new", None], 3: ["x", "y"]}, index=[10, 11])
+    assert dsm.get_column_value(df, 0, "PROPOSED URL") == "/new"
+    assert dsm.get_column_value(df, 1, "proposed url") == ""
+    assert dsm.get_column_value(df, 2, "PROPOSED URL") == ""
+    assert dsm.get_column_value(df, 0, "MISSING") == ""
+
+
+def test_get_row_data_reads_requested_columns():
+    df = pd.DataFrame({"Existing URL": ["http://a"], "PROPOSED URL": [None]})
+    assert dsm.get_row_data(df, 0) == {"EXISTING URL": "http://a", "PROPOSED URL": ""}
+    assert dsm.get_row_data(df, 0, ["existing url", "Nope"]) == {
+        "EXISTING URL": "http://a",
+        "NOPE": "",
+    }
+    assert dsm.get_row_data(df, 5) == {"EXISTING URL": "", "PROPOSED URL": ""}
+
+
+def test_cached_excel_file_reuses_and_bounds_parsed_sheets():
+    from unittest.mock import MagicMock
+
+    excel = MagicMock()
+    excel.parse.side_effect = lambda sheet_name, header: f"{sheet_name}:{header}"
+    cached = dsm.CachedExcelFile(excel, max_cached=2)
+
+    assert cached.parse(sheet_name="A", header=4) == "A:4"
+    assert cached.parse(sheet_name="A", header=4) == "A:4"
+    assert excel.parse.call_count == 1
+
+    cached.parse(sheet_name="B", header=4)
+    cached.parse(sheet_name="A", header=4)  # refresh A
+    cached.parse(sheet_name="C", header=4)  # evicts B
+    assert excel.parse.call_count == 3
+    cached.parse(sheet_name="A", header=4)
+    assert excel.parse.call_count == 3
+    cached.parse(sheet_name="B", header=4)
+    assert excel.parse.call_count == 4
+
+
+def test_get_latest_dsm_file_rescans_when_directory_changes(tmp_path, monkeypatch):
+    import os
+
+    monkeypatch.setattr(dsm, "DSM_DIR", tmp_path)
+    (tmp_path / "dsm-0101.xlsx").touch()
+    assert dsm.get_latest_dsm_file().endswith("dsm-0101.xlsx")
+
+    (tmp_path / "dsm-0202.xlsx").touch()
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert dsm.get_latest_dsm_file().endswith("dsm-0202.xlsx")
+
+
+def test_load_spreadsheet_reuses_unchanged_file(tmp_path):
+    import os
+
+    path = tmp_path / "dsm-0101.xlsx"
+    pd.DataFrame({"A": [1]}).to_excel(path, index=False)
+    first = dsm.load_spreadsheet(str(path))
+    assert dsm.load_spreadsheet(str(path)) is first
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert dsm.load_spreadsheet(str(path)) is not first
+
+
+def _lookup_sheets():
+    return {
+        "Enterprise": pd.DataFrame(
+            {
+                "EXISTING URL": [
+                    "https://web.musc.edu/a",
+                    "https://web.musc.edu/B/ https://web.musc.edu/c",
+                ],
+                "PROPOSED URL": ["/new/a", "/new/b"],
+            }
+        ),
+        "Adult Health": pd.DataFrame(
+            {
+                "EXISTING URL": ["https://web.musc.edu/a"],
+                "PROPOSED URL": ["/health/a"],
+            }
+        ),
+    }
+
+
+def _lookup_excel():
+    from unittest.mock import MagicMock
+
+    sheets = _lookup_sheets()
+
+    def parse(sheet_name, header):
+        if sheet_name not in sheets:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return sheets[sheet_name]
+
+    excel = MagicMock()
+    excel.parse.side_effect = parse
+    return excel
+
+
+_LOOKUP_LINKS = [
+    "https://web.musc.edu/a#top",
+    "https://web.musc.edu/b",
+    "https://web.musc.edu/c/",
+    "https://web.musc.edu/missing",
+]
+
+
+def test_lookup_links_in_dsm_matches_single_lookups():
+    excel = _lookup_excel()
+    links = _LOOKUP_LINKS
+    batch = dsm.lookup_links_in_dsm(links, excel)
+    assert batch == {link: dsm.lookup_link_in_dsm(link, excel) for link in links}
+    assert batch["https://web.musc.edu/a#top"]["proposed_url"] == "/new/a"
+    assert batch["https://web.musc.edu/b"]["row"] == 1
+    assert batch["https://web.musc.edu/missing"] == {"found": False}
+
+
+def test_lookup_with_state_uses_index_built_once():
+    from state import CLIState
+
+    state = CLIState()
+    state.excel_data = _lookup_excel()
+    scanned = {
+        link: dsm.lookup_link_in_dsm(link, _lookup_excel()) for link in _LOOKUP_LINKS
+    }
+
+    indexed = {
+        link: dsm.lookup_link_in_dsm(link, state=state) for link in _LOOKUP_LINKS
+    }
+    assert indexed == scanned
+    assert dsm.lookup_links_in_dsm(_LOOKUP_LINKS, state=state) == scanned
+    parses = state.excel_data.parse.call_count
+
+    dsm.lookup_link_in_dsm("https://web.musc.edu/b", state=state)
+    assert state.excel_data.parse.call_count == parses
+
+
+def test_lookup_link_in_dsm_checks_only_cells_containing_link():
+    from unittest.mock import MagicMock
+
+    df = pd.DataFrame(
+        {
+            "Existing URL ": [
+                None,
+                "https://web.musc.edu/ab",
+                "https://web.musc.edu/x, HTTPS://WEB.MUSC.EDU/A/",
+            ],
+            "PROPOSED URL": ["/none", "/ab", "/a"],
+        }
+    )
+    excel = MagicMock()
+    excel.parse.return_value = df
+
+    result = dsm.lookup_link_in_dsm("https://web.musc.edu/a", excel)
+    assert result["found"] is True
+    assert result["row"] == 2
+    assert result["proposed_url"] == "/a"
+    assert dsm.lookup_link_in_dsm("https://web.musc.edu/zz", excel) == {"found": False}
+
+
+def test_lookup_link_in_dsm_needs_the_whole_url():
+    from unittest.mock import MagicMock
+
+    df = pd.DataFrame(
+        {
+            "EXISTING URL": [
+                "https://web.musc.edu/a/b",
+                "https://web.musc.edu/a?x=1",
+                "see https://web.musc.edu/A// or https://web.musc.edu/a/",
+            ],
+            "PROPOSED URL": ["/child", "/query", "/a"],
+        }
+    )
+    excel = MagicMock()
+    excel.parse.return_value = df
+
+    result = dsm.lookup_link_in_dsm("https://web.musc.edu/a", excel)
+    assert result["row"] == 2
+    assert result["existing_url"] == "https://web.musc.edu/a/"
+
+
+def test_domain_settings_are_read_only():
+    import pytest
+
+    from constants import DOMAINS, DOMAINS_BY_NAME
+
+    with pytest.raises(TypeError):
+        DOMAINS[0]["worksheet_header_row"] = 9
+    assert DOMAINS_BY_NAME["hcc"] is DOMAINS_BY_NAME["hollings cancer center"]
+
+
+def test_domain_indexes_cover_shared_hosts():
+    from constants import DOMAINS_BY_HOSTNAME, INTERNAL_HOSTNAMES
+    from utils.sitecore import get_proposed_sitecore_root
+
+    names = [d["full_name"] for d in DOMAINS_BY_HOSTNAME["web.musc.edu"]]
+    assert names == ["Enterprise", "News Releases"]
+    assert INTERNAL_HOSTNAMES == set(DOMAINS_BY_HOSTNAME)
+    assert (
+        get_proposed_sitecore_root(
+            "https://muschealth.org/health-professionals/progressnotes/x"
+        )
+        == "Content Hub"
+    )
+    assert get_proposed_sitecore_root("https://muschealth.org/x") == "Health"
+
+
+def test_lookups_prefer_sheets_for_the_links_host():
+    from state import CLIState
+
+    link = "https://muschealth.org/care"
+    sheets = {
+        "Enterprise": pd.DataFrame(
+            {"EXISTING URL": [link], "PROPOSED URL": ["/enterprise"]}
+        ),
+        "Adult Health": pd.DataFrame(
+            {
+                "EXISTING URL": ["https://muschealth.org/x", link],
+                "PROPOSED URL": ["", "/health"],
+            }
+        ),
+    }
+    excel = _lookup_excel()
+    excel.parse.side_effect = lambda sheet_name, header: sheets[sheet_name]
+    state = CLIState()
+    state.excel_data = excel
+
+    for result in (
+        dsm.lookup_link_in_dsm(link, excel),
+        dsm.lookup_link_in_dsm(link, state=state),
+        dsm.lookup_links_in_dsm([link], excel)[link],
+    ):
+        assert (result["domain"], result["row"]) == ("Adult Health", 1)
+    assert dsm.lookup_link_in_dsm("https://other.org/care", excel)["found"] is False
+
+
+def test_dsm_index_streams_the_same_rows_pandas_parses(tmp_path):
+    import openpyxl
+
+    path = tmp_path / "dsm-0101.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Enterprise"
+    for row in (
+        [],
+        ["Title"],
+        [],
+        ["PROPOSED URL", "Notes", " Existing URL"],
+        ["/p1", 1, "https://web.musc.edu/a"],
+        [],
+        [5, None, "https://web.musc.edu/b/ https://web.musc.edu/c"],
+        [None, None, "https://web.musc.edu/d"],
+        [None, None, ""],
+    ):
+        ws.append(row)
+    # Sheet whose used range starts below the first row
+    health = wb.create_sheet("Adult Health")
+    health["C3"], health["D3"] = "EXISTING URL", "PROPOSED URL"
+    health["C5"], health["D5"] = "https://muschealth.org/q", "/q"
+    wb.save(path)
+
+    def rows(index):
+        return {
+            key: {name: entry[1:] for name, entry in matches.items()}
+            for key, matches in index.items()
+        }
+
+    streamed = dsm.build_dsm_index(dsm.load_spreadsheet(str(path)))
+    parsed = dsm.build_dsm_index(pd.ExcelFile(path))
+    assert rows(streamed) == rows(parsed)
+    assert rows(streamed)["https://web.musc.edu/c"] == {
+        "Enterprise": (2, "https://web.musc.edu/c", "5")
+    }
+    assert rows(streamed)["https://muschealth.org/q"] == {
+        "Adult Health": (1, "https://muschealth.org/q", "/q")
+    }
@@ -1,8 +1,18 @@
 import json
 from commands.report import (
+    _build_link_item_html,
     _build_sitecore_nav_js,
+    _capture_report_sections,
+    _collect_page_items,
     _format_display_url,
     _generate_consolidated_section,
+    _generate_html_report,
+    _get_copy_value,
+    _hierarchy_tree_html,
+    _load_report_template,
+    _report_fingerprint,
+    _report_is_current,
+    _sync_report_static_assets,
 )
 from state import CLIState
 from unittest.mock import patch
@@ -364,6 +374,126 @@ class TestFormatDisplayUrl:
         assert len(formatted) <= 60
 
 
+class TestGenerateHtmlReport:
+    """Tests for filling the report template."""
+
+    def test_escapes_captured_output(self):
+        html = _generate_html_report(
+            "Domain", "5", "a < b & c", "<a href='x'>", "<div>ok</div>"
+        )
+        assert "a &lt; b &amp; c" in html
+        assert "&lt;a href='x'&gt;" in html
+        assert "<div>ok</div>" in html
+
+    def test_streams_same_report_to_file(self):
+        from io import StringIO
+
+        args = ("Domain", "5", "a < b", "links", "<div>ok</div>", "k1", True)
+        out = StringIO()
+        with patch("commands.report.datetime") as dt:
+            dt.now.return_value.strftime.return_value = "2024-01-01 00:00:00"
+            assert _generate_html_report(*args, out=out) is None
+            assert out.getvalue() == _generate_html_report(*args)
+
+
+class TestGenerateReportWrite:
+    """Tests for writing the report file."""
+
+    def _generate(self, tmp_path, monkeypatch, template_error=None):
+        from commands import report
+
+        monkeypatch.chdir(tmp_path)
+        state = CLIState()
+        state.current_page_data = {"links": []}
+        state.set_variable("DOMAIN", "COM")
+        state.set_variable("ROW", "5")
+        monkeypatch.setattr(
+            report, "_is_cache_valid_for_context", lambda *_: (True, "")
+        )
+        monkeypatch.setattr(
+            report, "_capture_report_sections", lambda *_: ("page", "links", "")
+        )
+
+        def load_template():
+            if template_error is not None:
+                raise template_error
+            return "<p>{domain} {row}</p>"
+
+        monkeypatch.setattr(report, "_load_report_template", load_template)
+        report._generate_report(
+            state, prompt_open=False, force_regenerate=True, sync_assets=False
+        )
+        return tmp_path / "reports"
+
+    def test_template_error_leaves_no_report(self, tmp_path, monkeypatch):
+        reports = self._generate(tmp_path, monkeypatch, OSError("missing"))
+        assert list(reports.iterdir()) == []
+
+    def test_failed_rewrite_keeps_previous_report(self, tmp_path, monkeypatch):
+        reports = self._generate(tmp_path, monkeypatch)
+        html = (reports / "com_5.html").read_text(encoding="utf-8")
+        fingerprint = (reports / "com_5.html.hash").read_text(encoding="utf-8")
+
+        self._generate(tmp_path, monkeypatch, OSError("missing"))
+        assert sorted(p.name for p in reports.iterdir()) == [
+            "com_5.html",
+            "com_5.html.hash",
+        ]
+        assert (reports / "com_5.html").read_text(encoding="utf-8") == html
+        assert (reports / "com_5.html.hash").read_text(encoding="utf-8") == fingerprint
+
+
+class TestGetCopyValue:
+    """Tests for the _get_copy_value helper."""
+
+    def test_normalises_phone_numbers(self):
+        assert _get_copy_value("tel:(843) 555-1234") == "tel:+18435551234"
+        assert _get_copy_value("tel:1-843-555-1234") == "tel:+18435551234"
+        assert _get_copy_value("tel:555-1234") == "tel:555-1234"
+
+    def test_pdf_copy_value_uses_parsed_path(self):
+        from urllib.parse import urlparse
+
+        href = "https://musc.edu/files/Guide.PDF"
+        assert _get_copy_value(href) == "/files/Guide.PDF"
+        assert _get_copy_value(href, urlparse(href)) == "/files/Guide.PDF"
+
+
+class TestHierarchyTreeHtml:
+    def test_indents_each_level(self):
+        assert _hierarchy_tree_html(["a", "b"]) == "   |-- a<br>      |-- b<br>"
+        deep = _hierarchy_tree_html(["x"] * 40)
+        assert deep.endswith(" " * 120 + "|-- x<br>")
+
+
+class TestBuildLinkItemHtml:
+    def test_escapes_link_values(self):
+        html = _build_link_item_html(
+            "pdf", ("O'Brien & <Co>", "https://a.com/x.pdf", "200"), {}
+        )
+        assert ">O&#x27;Brien &amp; &lt;Co&gt;</a>" in html
+        assert "copyToClipboard(event, &quot;/x.pdf&quot;)" in html
+        assert (
+            "copyAnchorToClipboard(event, &quot;/x.pdf&quot;, "
+            "&quot;O&#x27;Brien &amp; &lt;Co&gt;&quot;, 'pdf')"
+        ) in html
+
+
+class TestCollectPageItems:
+    def test_orders_items_by_type(self):
+        page_data = {
+            "embeds": [("Video", "https://player.vimeo.com/video/1")],
+            "sidebar_links": [("Side", "https://a.com/side", "200")],
+            "links": [("Main", "https://a.com/", "200")],
+            "sidebar_pdfs": [],
+        }
+        assert _collect_page_items(page_data) == [
+            ("link", ("Main", "https://a.com/", "200")),
+            ("sidebar_link", ("Side", "https://a.com/side", "200")),
+            ("embed", ("Video", "https://player.vimeo.com/video/1")),
+        ]
+
+
 class TestGenerateConsolidatedSection:
     """Tests for consolidated section generation."""
 
@@ -384,8 +514,11 @@ class TestGenerateConsolidatedSection:
         ), patch(
             "utils.sitecore.get_proposed_sitecore_root", return_value="Root"
         ), patch(
-            "data.dsm.lookup_link_in_dsm",
-            return_value={"proposed_hierarchy": {"segments": ["Page"], "root": "Root"}},
+            "commands.report.lookup_links_in_dsm",
+            side_effect=lambda hrefs, *_: {
+                href: {"proposed_hierarchy": {"segments": ["Page"], "root": "Root"}}
+                for href in hrefs
+            },
         ):
             html = _generate_consolidated_section(state)
 
@@ -394,3 +527,169 @@ class TestGenerateConsolidatedSection:
 
         # All items should display their URL strings
         assert html.count('class="link-url"') == 4
+
+    def test_internal_hierarchy_joins_segments(self):
+        state = CLIState()
+        state.set_variable("URL", "https://musckids.org/page")
+        state.current_page_data = {"links": [("Page", "https://musckids.org/a", 200)]}
+
+        with patch(
+            "utils.sitecore.get_current_sitecore_root", return_value="Root"
+        ), patch(
+            "utils.sitecore.get_proposed_sitecore_root", return_value="Root"
+        ), patch(
+            "commands.report.lookup_links_in_dsm",
+            side_effect=lambda hrefs, *_: {
+                href: {"proposed_hierarchy": {"segments": ["A", "B"], "root": "Sites"}}
+                for href in hrefs
+            },
+        ) as lookup:
+            html = _generate_consolidated_section(state)
+
+        assert "<div class='internal-hierarchy'>   → Sites / A / B</div>" in html
+        lookup.assert_called_once()
+
+
+class TestLoadReportTemplate:
+    def test_rereads_only_when_template_changes(self, tmp_path):
+        import os
+
+        template = tmp_path / "template.html"
+        template.write_text("first")
+        stat = template.stat()
+
+        with patch("commands.report._get_report_template_dir", return_value=tmp_path):
+            assert _load_report_template() == "first"
+
+            template.write_text("second")
+            os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert _load_report_template() == "first"
+
+            os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert _load_report_template() == "second"
+
+
+class TestSyncReportStaticAssets:
+    def test_copies_only_missing_or_stale_assets(self, tmp_path):
+        template_dir = tmp_path / "templates"
+        reports_dir = tmp_path / "reports"
+        template_dir.mkdir()
+        reports_dir.mkdir()
+        (template_dir / "report.css").write_text("body {}")
+        (template_dir / "report.js").write_text("let a;")
+        (template_dir / "report.html").write_text("<html></html>")
+
+        with patch(
+            "commands.report._get_report_template_dir", return_value=template_dir
+        ), patch("commands.report.shutil.copyfile") as copy:
+            _sync_report_static_assets(reports_dir)
+            assert copy.call_count == 2
+
+            (reports_dir / "report.css").write_text("body {}")
+            (reports_dir / "report.js").write_text("stale")
+            copy.reset_mock()
+            _sync_report_static_assets(reports_dir)
+            copy.assert_called_once_with(
+                template_dir / "report.js", reports_dir / "report.js"
+            )
+
+
+class TestCaptureReportSections:
+    def test_reuses_sections_until_cache_file_changes(self, tmp_path):
+        import os
+
+        cache_file = tmp_path / "page_check_COM-5.json"
+        cache_file.write_text("{}")
+        state = CLIState()
+        state.current_page_data = {"links": []}
+        state.set_variable("URL", "https://example.com")
+
+        with patch(
+            "commands.report._capture_output", return_value="captured"
+        ) as capture, patch(
+            "commands.report._generate_consolidated_section", return_value="summary"
+        ) as consolidated:
+            first = _capture_report_sections(state, str(cache_file))
+            second = _capture_report_sections(state, str(cache_file))
+            assert first == second == ("captured", "captured", "summary")
+            assert capture.call_count == 2
+            assert consolidated.call_count == 1
+
+            stat = cache_file.stat()
+            os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            _capture_report_sections(state, str(cache_file))
+            assert consolidated.call_count == 2
+
+            state.set_variable("URL", "https://example.com/other")
+            _capture_report_sections(state, str(cache_file))
+            assert consolidated.call_count == 3
+
+    def test_force_regenerate_and_dsm_change_recapture(self, tmp_path):
+        import os
+
+        cache_file = tmp_path / "page_check_COM-5.json"
+        cache_file.write_text("{}")
+        dsm_file = tmp_path / "dsm.xlsx"
+        dsm_file.write_text("")
+        state = CLIState()
+        state.current_page_data = {"links": []}
+        state.set_variable("DSM_FILE", str(dsm_file))
+
+        with patch("commands.report._capture_output", return_value="captured"), patch(
+            "commands.report._generate_consolidated_section", return_value="summary"
+        ) as consolidated:
+            _capture_report_sections(state, str(cache_file))
+            _capture_report_sections(state, str(cache_file), force_regenerate=True)
+            assert consolidated.call_count == 2
+
+            stat = dsm_file.stat()
+            os.utime(dsm_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            _capture_report_sections(state, str(cache_file))
+            assert consolidated.call_count == 3
+
+    def test_keeps_a_bounded_number_of_entries(self, tmp_path):
+        from commands.report import _REPORT_FRAGMENTS_MAX
+
+        state = CLIState()
+        state.current_page_data = {"links": []}
+
+        with patch("commands.report._capture_output", return_value="captured"), patch(
+            "commands.report._generate_consolidated_section", return_value="summary"
+        ):
+            for row in range(_REPORT_FRAGMENTS_MAX + 3):
+                cache_file = tmp_path / f"page_check_COM-{row}.json"
+                cache_file.write_text("{}")
+                _capture_report_sections(state, str(cache_file))
+
+        assert len(state._report_fragments) == _REPORT_FRAGMENTS_MAX
+
+
+class TestReportIsCurrent:
+    def test_matches_fingerprint_of_unchanged_page_data(self, tmp_path):
+        report = tmp_path / "com_5.html"
+        report.write_text("<html></html>")
+        state = CLIState()
+        state.current_page_data = {"links": [("a", "https://example.com", 200)]}
+
+        assert not _report_is_current(state, report)
+
+        (tmp_path / "com_5.html.hash").write_text(_report_fingerprint(state))
+        # Cached page data comes back from JSON with lists instead of tuples
+        state.current_page_data = {"links": [["a", "https://example.com", 200]]}
+        assert _report_is_current(state, report)
+
+        state.set_variable("KANBAN_ID", "abc")
+        assert not _report_is_current(state, report)
+
+    def test_check_leaves_report_mtime_alone(self, tmp_path):
+        import os
+
+        report = tmp_path / "com_5.html"
+        report.write_text("<html></html>")
+        os.utime(report, ns=(0, 1_000_000_000))
+        state = CLIState()
+        state.current_page_data = {"links": []}
+        (tmp_path / "com_5.html.hash").write_text(_report_fingerprint(state))
+
+        assert _report_is_current(state, report)
+        assert report.stat().st_mtime_ns == 1_000_000_000
@@ -38,3 +38,66 @@ def test_extract_embeds_and_skip_from_links():
 
     embeds = extract_embeds_from_page(soup)
     assert embeds == [("Sample Video", "https://player.vimeo.com/video/12345")]
+
+
+def test_http_session_is_reused_per_thread():
+    import threading
+
+    from utils.core import http_session
+
+    assert http_session() is http_session()
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(http_session()))
+    worker.start()
+    worker.join()
+    assert other[0] is not http_session()
+
+
+def test_links_are_status_checked_concurrently_once_each():
+    import threading
+
+    html = """
+    <div id='main'>
+        <a href='/a'>A</a>
+        <a href='/doc.pdf'>Doc</a>
+        <a href='/a'>A again</a>
+    </div>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    response = SimpleNamespace(url="http://base.com/")
+    # Both distinct URLs must be in flight at once for either check to finish
+    barrier = threading.Barrier(2, timeout=5)
+    checked = []
+
+    def check(url):
+        checked.append(url)
+        barrier.wait()
+        return "404" if url.endswith(".pdf") else "200"
+
+    with patch("utils.scraping.check_status_code", side_effect=check):
+        links, pdfs = extract_links_from_page(soup, response)
+
+    assert sorted(checked) == ["http://base.com/a", "http://base.com/doc.pdf"]
+    assert links == [
+        ("A", "http://base.com/a", "200"),
+        ("A again", "http://base.com/a", "200"),
+    ]
+    assert pdfs == [("Doc", "http://base.com/doc.pdf", "404")]
+
+
+def test_missing_selector_fallback_prints_nothing(capsys):
+    soup = BeautifulSoup('<a href="http://example.com">Example</a>', "html.parser")
+    response = SimpleNamespace(url="http://base.com")
+
+    with patch("utils.scraping.check_status_code", return_value="200"), patch(
+        "utils.scraping.debug_print"
+    ) as debug:
+        links, _ = extract_links_from_page(soup, response)
+        embeds = extract_embeds_from_page(soup)
+
+    assert links == [("Example", "http://example.com", "200")]
+    assert embeds == []
+    assert capsys.readouterr().out == ""
+    warnings = [c.args[0] for c in debug.call_args_list if "falling back" in c.args[0]]
+    assert len(warnings) == 2
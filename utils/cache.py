@@ -1,4 +1,5 @@
 import json
+import os
 import re
 from pathlib import Path
 from datetime import datetime
@@ -9,7 +10,12 @@ CACHE_DIR = Path("migration_cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
 
-def _cache_page_data(state, url, data):
+def _cache_page_data(state, url, data, compact=False):
+    """Write ``data`` to the cache file for the current context.
+
+    ``compact`` drops the indentation, which makes the file noticeably
+    smaller and faster to write for pages with long link lists.
+    """
     domain = state.get_variable("DOMAIN")
     row = state.get_variable("ROW")
     kanban_id = state.get_variable("KANBAN_ID")
@@ -41,8 +47,15 @@ def _cache_page_data(state, url, data):
 
     try:
         with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            if compact:
+                json.dump(cache_data, f, separators=(",", ":"), ensure_ascii=False)
+            else:
+                json.dump(cache_data, f, indent=2, ensure_ascii=False)
         state.set_variable("CACHE_FILE", str(cache_file))
+        # The file may have been rewritten within one mtime tick, so drop the
+        # memos keyed on it rather than trusting the timestamp
+        state._last_cache_lookup = None
+        state._cache_validity = None
         print(f"✅ Data cached to {cache_file}")
         debug_print(f"Cache metadata: {cache_data['metadata']}")
     except Exception as e:
@@ -99,43 +112,90 @@ def _load_cached_page_data(cache_file_path):
 
 
 def _is_cache_valid_for_context(state, cache_file):
+    """Return ``(is_valid, reason)`` for ``cache_file`` against the current context.
+
+    The result is memoised on ``state`` and reused while the URL, domain,
+    row, sidebar setting and the cache file's mtime and size are unchanged,
+    so repeated checks don't re-open and re-parse the JSON file.
+    :func:`_cache_page_data` clears the memo whenever it writes a file.
+    """
     if not cache_file:
         return False, "No cache file specified"
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return _check_cache_for_context(state, cache_file)
+
+    key = (
+        str(cache_file),
+        stat.st_mtime_ns,
+        stat.st_size,
+        state.get_variable("URL"),
+        state.get_variable("DOMAIN"),
+        state.get_variable("ROW"),
+        state.get_variable("INCLUDE_SIDEBAR"),
+    )
+    memo = getattr(state, "_cache_validity", None)
+    if memo is not None and memo[0] == key:
+        debug_print(f"Reusing cache validation result for {cache_file}")
+        return memo[1]
+
+    result = _check_cache_for_context(state, cache_file)
+    state._cache_validity = (key, result)
+    return result
+
+
+def _check_cache_for_context(state, cache_file):
     try:
         metadata, page_data = _load_cached_page_data(cache_file)
-        if not metadata:
-            return False, "Cache file contains no metadata"
+        return _check_cached_page(state, metadata, page_data)
+    except Exception as e:
+        debug_print(f"Error validating cache: {e}")
+        return False, f"Error validating cache: {e}"
 
-        # Check if metadata structure is current
-        if not _is_metadata_structure_current(metadata):
-            return False, "Metadata structure is outdated"
 
-        # Check if page_data contains meta_description and meta_robots
-        if (
-            not page_data
-            or "meta_description" not in page_data
-            or "meta_robots" not in page_data
-        ):
-            return False, "Cache missing meta description or robots data"
-
-        current_url = state.get_variable("URL")
-        current_domain = state.get_variable("DOMAIN")
-        current_row = state.get_variable("ROW")
-        current_include_sidebar = state.get_variable("INCLUDE_SIDEBAR")
-
-        cached_url = metadata.get("url")
-        cached_domain = metadata.get("domain")
-        cached_row = metadata.get("row")
-        cached_include_sidebar = metadata.get("include_sidebar", False)
-
-        if current_url and cached_url:
-            url_matches = normalize_url(cached_url) == normalize_url(current_url)
-            if not url_matches:
-                return (
-                    False,
-                    f"URL mismatch: cached={cached_url}, current={current_url}",
-                )
+def _check_cached_page(
+    state, metadata, page_data, ignore_domain_row=False, match_selector=False
+):
+    """Return ``(is_valid, reason)`` for cached page data against ``state``.
+
+    ``ignore_domain_row`` accepts data cached for another DSM row, and
+    ``match_selector`` also requires the cached CSS selector to match.
+    """
+    if not metadata:
+        return False, "Cache file contains no metadata"
+
+    # Check if metadata structure is current
+    if not _is_metadata_structure_current(metadata):
+        return False, "Metadata structure is outdated"
+
+    # Check if page_data contains meta_description and meta_robots
+    if (
+        not page_data
+        or "meta_description" not in page_data
+        or "meta_robots" not in page_data
+    ):
+        return False, "Cache missing meta description or robots data"
+
+    current_url = state.get_variable("URL")
+    current_domain = state.get_variable("DOMAIN")
+    current_row = state.get_variable("ROW")
+    current_include_sidebar = state.get_variable("INCLUDE_SIDEBAR")
+
+    cached_url = metadata.get("url")
+    cached_domain = metadata.get("domain")
+    cached_row = metadata.get("row")
+    cached_include_sidebar = metadata.get("include_sidebar", False)
+
+    if current_url and cached_url:
+        url_matches = normalize_url(cached_url) == normalize_url(current_url)
+        if not url_matches:
+            return (
+                False,
+                f"URL mismatch: cached={cached_url}, current={current_url}",
+            )
 
+    if not ignore_domain_row:
         if current_domain and cached_domain and cached_domain != current_domain:
             return (
                 False,
@@ -145,18 +205,48 @@ def _is_cache_valid_for_context(state, cache_file):
         if current_row and cached_row and cached_row != current_row:
             return False, f"Row mismatch: cached={cached_row}, current={current_row}"
 
-        sidebar_compatible = (not current_include_sidebar) or (
-            current_include_sidebar and cached_include_sidebar
-        )
-        if not sidebar_compatible:
+    if match_selector:
+        current_selector = state.get_variable("SELECTOR")
+        cached_selector = metadata.get("selector")
+        if cached_selector != current_selector:
             return (
                 False,
-                f"Sidebar compatibility: need sidebar={current_include_sidebar}, cached sidebar={cached_include_sidebar}",
+                f"Selector mismatch: cached={cached_selector}, current={current_selector}",
             )
-        return True, "Cache is valid for current context"
-    except Exception as e:
-        debug_print(f"Error validating cache: {e}")
-        return False, f"Error validating cache: {e}"
+
+    sidebar_compatible = (not current_include_sidebar) or (
+        current_include_sidebar and cached_include_sidebar
+    )
+    if not sidebar_compatible:
+        return (
+            False,
+            f"Sidebar compatibility: need sidebar={current_include_sidebar}, cached sidebar={cached_include_sidebar}",
+        )
+    return True, "Cache is valid for current context"
+
+
+def _find_reusable_page_data_for_url(state):
+    """Return page data cached for the current URL under any DSM row, or ``None``.
+
+    The cache file is looked up by URL alone, so a page already fetched for
+    another row is found even when this row has a stale cache file of its
+    own. The cached selector must match the current one, since it decided
+    which links were extracted.
+    """
+    url = state.get_variable("URL")
+    cache_file = _find_cache_file_for_url(url)
+    if not cache_file:
+        return None
+    metadata, page_data = _load_cached_page_data(cache_file)
+    if not metadata.get("url"):
+        return None
+    is_valid, reason = _check_cached_page(
+        state, metadata, page_data, ignore_domain_row=True, match_selector=True
+    )
+    if not is_valid:
+        debug_print(f"Cache for {url} can't be reused: {reason}")
+        return None
+    return page_data
 
 
 def _find_cache_file_for_domain_row(domain, row):
@@ -189,6 +279,48 @@ def _find_cache_file_for_url(url):
     return None
 
 
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _lookup_cache_for_context(state, url, domain, row):
+    """Find and load the cache file for a URL/domain/row context.
+
+    Returns ``(cache_file, metadata, page_data)``. The last lookup is
+    memoised on ``state`` and reused while the context, the cache directory
+    listing and the matched file's mtime are unchanged, which avoids
+    rescanning every cache file when the same row is loaded repeatedly.
+    """
+    key = (url, domain, row, _mtime_ns(CACHE_DIR))
+    memo = getattr(state, "_last_cache_lookup", None)
+    if memo is not None and memo[0] == key:
+        cache_file, file_mtime, metadata, page_data = memo[1]
+        if cache_file is None or _mtime_ns(cache_file) == file_mtime:
+            debug_print(f"Reusing cache lookup for {url or f'{domain}-{row}'}")
+            return cache_file, metadata, page_data
+
+    cache_file = None
+    if domain and row:
+        cache_file = _find_cache_file_for_domain_row(domain, row)
+    if not cache_file and url:
+        cache_file = _find_cache_file_for_url(url)
+
+    file_mtime = None
+    metadata, page_data = {}, {}
+    if cache_file:
+        file_mtime = _mtime_ns(cache_file)
+        try:
+            metadata, page_data = _load_cached_page_data(cache_file)
+        except Exception as e:
+            debug_print(f"Error loading cached page data from {cache_file}: {e}")
+
+    state._last_cache_lookup = (key, (cache_file, file_mtime, metadata, page_data))
+    return cache_file, metadata, page_data
+
+
 def _update_state_from_cache(state, url=None, domain=None, row=None):
     """
     Updates the state object with data from a cache file based on the provided
@@ -217,8 +349,9 @@ def _update_state_from_cache(state, url=None, domain=None, row=None):
         Exception: If an error occurs while loading cached page data from the file.
 
     Note:
-        This function relies on helper functions `_find_cache_file_for_domain_row`,
-        `_find_cache_file_for_url`, and `_load_cached_page_data` to perform its operations.
+        This function relies on `_lookup_cache_for_context`, which wraps
+        `_find_cache_file_for_domain_row`, `_find_cache_file_for_url`, and
+        `_load_cached_page_data` and reuses the previous lookup when nothing changed.
     """
 
     current_cache_file = state.get_variable("CACHE_FILE")
@@ -226,11 +359,9 @@ def _update_state_from_cache(state, url=None, domain=None, row=None):
     search_domain = domain or state.get_variable("DOMAIN")
     search_row = row or state.get_variable("ROW")
 
-    found_cache_file = None
-    if search_domain and search_row:
-        found_cache_file = _find_cache_file_for_domain_row(search_domain, search_row)
-    if not found_cache_file and search_url:
-        found_cache_file = _find_cache_file_for_url(search_url)
+    found_cache_file, metadata, page_data = _lookup_cache_for_context(
+        state, search_url, search_domain, search_row
+    )
 
     if current_cache_file and found_cache_file != current_cache_file:
         debug_print(
@@ -242,7 +373,6 @@ def _update_state_from_cache(state, url=None, domain=None, row=None):
     if found_cache_file:
         state.set_variable("CACHE_FILE", found_cache_file)
         try:
-            metadata, page_data = _load_cached_page_data(found_cache_file)
             if page_data:
                 state.current_page_data = page_data
                 if metadata:
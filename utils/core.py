@@ -2,11 +2,11 @@
 Utility functions for Linker CLI.
 """
 
-import requests
 from urllib.parse import urlparse
 import socket
+import threading
 
-from constants import DOMAIN_MAPPING
+from constants import INTERNAL_HOSTNAMES
 from utils.sitecore import format_hierarchy
 
 # from constants import DOMAIN_MAPPING
@@ -23,13 +23,22 @@ def sync_debug_with_state(state):
 
 
 def debug_print(*msg):
-    """Print debug messages if DEBUG is enabled."""
+    """Print debug messages if DEBUG is enabled.
+
+    Several arguments are joined with spaces. Passing values this way rather
+    than as one f-string defers formatting them until debugging is on.
+    """
     if DEBUG and len(msg) == 1:
         print(f"DEBUG: {msg[0]}")
     elif DEBUG and len(msg) > 1:
         print("DEBUG:", " ".join(str(m) for m in msg))
 
 
+def is_debug_enabled():
+    """Return True if debug output is currently enabled."""
+    return bool(DEBUG)
+
+
 def set_debug(enabled, state):
     """Set the global debug flag."""
     # Update state variable
@@ -41,13 +50,35 @@ def set_debug(enabled, state):
         debug_print(f"Debugging is {'enabled' if enabled else 'disabled'}")
 
 
+# Per-thread requests.Session so repeated requests reuse pooled connections
+_http_local = threading.local()
+
+
+def http_session():
+    """Return this thread's shared ``requests.Session``.
+
+    Sessions keep connections alive between requests to the same host, which
+    matters when a page links to dozens of URLs on one site. One session is
+    kept per thread because ``requests.Session`` is not thread-safe.
+    """
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        import requests  # deferred: only needed once pages are fetched
+
+        session = requests.Session()
+        _http_local.session = session
+    return session
+
+
 def check_status_code(url):
     # if the URL is has URI, skip
     if not urlparse(url).scheme:
         debug_print(f"Skipping status check for URL without scheme: {url}")
         return "0"
+    import requests  # deferred: only needed once links are actually checked
+
     try:
-        response = requests.head(url, allow_redirects=True, timeout=3)
+        response = http_session().head(url, allow_redirects=True, timeout=3)
         debug_print(f"Checked URL: {url} - Status Code: {response.status_code}")
         return str(response.status_code)
     except (requests.Timeout, requests.exceptions.ReadTimeout, socket.timeout) as e:
@@ -65,59 +96,59 @@ def normalize_url(url):
     return url
 
 
-def output_internal_links_analysis_detail(state):
-    from data.dsm import lookup_link_in_dsm
+def output_internal_links_analysis_detail(state, file=None):
+    from data.dsm import lookup_links_in_dsm
 
     """Output detailed analysis of internal links and the new paths they should take if available."""
     debug_print("Analyzing internal links...")
-    debug_print(f"Current page data: {state.current_page_data}")
-    if not state.current_page_data:
+    page_data = state.current_page_data
+    debug_print(f"Current page data: {page_data}")
+    if not page_data:
         print(
-            "❌ No page data available. Run 'check' first to analyze the current page."
+            "❌ No page data available. Run 'check' first to analyze the current page.",
+            file=file,
         )
         return
 
-    links = [
-        *state.current_page_data.get("links", []),
-        *state.current_page_data.get("sidebar_links", []),
-    ]
-    pdfs = [
-        *state.current_page_data.get("pdfs", []),
-        *state.current_page_data.get("sidebar_pdfs", []),
-    ]
+    links = [*page_data.get("links", []), *page_data.get("sidebar_links", [])]
+    pdfs = [*page_data.get("pdfs", []), *page_data.get("sidebar_pdfs", [])]
 
     if not links and not pdfs:
-        print("No links found on the current page.")
+        print("No links found on the current page.", file=file)
         return
 
-    print("🔗 ANALYZING INTERNAL LINKS")
-    print("=" * 50)
+    print("🔗 ANALYZING INTERNAL LINKS", file=file)
+    print("=" * 50, file=file)
 
     # Filter out internal links based on known domains
-    internal_domains = set(DOMAIN_MAPPING.keys())
-
     internal_links = []
 
     for text, href, status in links + pdfs:
         parsed = urlparse(href)
-        if parsed.hostname in internal_domains:
+        if parsed.hostname in INTERNAL_HOSTNAMES:
             internal_links.append((text, href, status))
 
     if not internal_links:
-        print("✅ No internal links found.")
+        print("✅ No internal links found.", file=file)
         return
 
-    print(f"Found {len(internal_links)} internal links:")
-    print()
+    print(f"Found {len(internal_links)} internal links:", file=file)
+    print(file=file)
+
+    # Look every link up together rather than one DSM search per link
+    results = lookup_links_in_dsm(
+        [href for _, href, _ in internal_links], state.excel_data, state
+    )
 
     for i, (text, href, status) in enumerate(internal_links, 1):
-        print(f"{i:2}. {text[:60]}")
-        print(f"    🔗 {href}")
+        print(f"{i:2}. {text[:60]}", file=file)
+        print(f"    🔗 {href}", file=file)
 
-        # Perform automatic lookup
-        result = lookup_link_in_dsm(href, state.excel_data, state)
+        result = results[href]
         if result["found"]:
-            print(f"    ✅ Found in DSM - {result['domain']} - {result['row']}")
+            print(
+                f"    ✅ Found in DSM - {result['domain']} - {result['row']}", file=file
+            )
             # use shared formatting for new path
             path_str = format_hierarchy(
                 result["proposed_hierarchy"]["root"],
@@ -126,98 +157,99 @@ def output_internal_links_analysis_detail(state):
             for idx, line in enumerate(path_str.split("\n")):
                 # Prefix first line with 🎯, subsequent lines align
                 prefix = "    " if idx == 0 else "       "
-                print(f"{prefix} {line}")
+                print(f"{prefix} {line}", file=file)
         else:
-            print(f"    ❌ Not found in DSM")
-        print()
+            print(f"    ❌ Not found in DSM", file=file)
+        print(file=file)
 
     print(
-        "💡 Use 'lookup <url>' for detailed navigation instructions for any specific link"
+        "💡 Use 'lookup <url>' for detailed navigation instructions for any specific link",
+        file=file,
     )
 
 
-def display_page_data(data):
-    print("\n" + "=" * 60)
-    print("EXTRACTED PAGE DATA")
-    print("=" * 60)
+def display_page_data(data, file=None):
+    print("\n" + "=" * 60, file=file)
+    print("EXTRACTED PAGE DATA", file=file)
+    print("=" * 60, file=file)
     if "error" in data:
-        print(f"❌ Error occurred: {data['error']}")
+        print(f"❌ Error occurred: {data['error']}", file=file)
         return
-    print(f"📄 Source URL: {data.get('url', 'Unknown')}")
-    print(f"🎯 CSS Selector: {data.get('selector_used', 'Unknown')}")
+    print(f"📄 Source URL: {data.get('url', 'Unknown')}", file=file)
+    print(f"🎯 CSS Selector: {data.get('selector_used', 'Unknown')}", file=file)
     if data.get("include_sidebar", False):
-        print("🔲 Sidebar inclusion: ENABLED")
-    print()
+        print("🔲 Sidebar inclusion: ENABLED", file=file)
+    print(file=file)
 
     # Display main content
     links = data.get("links", [])
-    print(f"🔗 LINKS FOUND: {len(links)}")
+    print(f"🔗 LINKS FOUND: {len(links)}", file=file)
     if links:
-        print("-" * 40)
+        print("-" * 40, file=file)
         for i, (text, href, status) in enumerate(links, 1):
             status_icon = (
                 "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
             )
-            print(f"{i:2}. {status_icon} [{status}] {text[:50]}")
-            print(f"    → {href}")
+            print(f"{i:2}. {status_icon} [{status}] {text[:50]}", file=file)
+            print(f"    → {href}", file=file)
 
     # Display sidebar links if they exist (with subtle distinction)
     sidebar_links = data.get("sidebar_links", [])
     if sidebar_links:
-        print()
-        print(f"🔗 SIDEBAR LINKS: {len(sidebar_links)}")
-        print("-" * 40)
+        print(file=file)
+        print(f"🔗 SIDEBAR LINKS: {len(sidebar_links)}", file=file)
+        print("-" * 40, file=file)
         for i, (text, href, status) in enumerate(sidebar_links, len(links) + 1):
             status_icon = (
                 "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
             )
             # Add subtle indicator with │ character
-            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
-            print(f"   │→ {href}")
+            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}", file=file)
+            print(f"   │→ {href}", file=file)
 
-    print()
+    print(file=file)
     pdfs = data.get("pdfs", [])
-    print(f"📄 PDF FILES: {len(pdfs)}")
+    print(f"📄 PDF FILES: {len(pdfs)}", file=file)
     if pdfs:
-        print("-" * 40)
+        print("-" * 40, file=file)
         for i, (text, href, status) in enumerate(pdfs, 1):
             status_icon = (
                 "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
             )
-            print(f"{i:2}. {status_icon} [{status}] {text[:50]}")
-            print(f"    → {href}")
+            print(f"{i:2}. {status_icon} [{status}] {text[:50]}", file=file)
+            print(f"    → {href}", file=file)
 
     # Display sidebar PDFs if they exist
     sidebar_pdfs = data.get("sidebar_pdfs", [])
     if sidebar_pdfs:
-        print()
-        print(f"📄 SIDEBAR PDF FILES: {len(sidebar_pdfs)}")
-        print("-" * 40)
+        print(file=file)
+        print(f"📄 SIDEBAR PDF FILES: {len(sidebar_pdfs)}", file=file)
+        print("-" * 40, file=file)
         for i, (text, href, status) in enumerate(sidebar_pdfs, len(pdfs) + 1):
             status_icon = (
                 "✅" if status.startswith("2") else "❌" if status != "0" else "⚠️"
             )
-            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}")
-            print(f"   │→ {href}")
+            print(f"{i:2}.│{status_icon} [{status}] {text[:50]}", file=file)
+            print(f"   │→ {href}", file=file)
 
-    print()
+    print(file=file)
     embeds = data.get("embeds", [])
-    print(f"🎬 VIMEO EMBEDS: {len(embeds)}")
+    print(f"🎬 VIMEO EMBEDS: {len(embeds)}", file=file)
     if embeds:
-        print("-" * 40)
+        print("-" * 40, file=file)
         for i, (title, src) in enumerate(embeds, 1):
-            print(f"{i:2}. [VIMEO] {title[:50]}")
-            print(f"    → {src}")
+            print(f"{i:2}. [VIMEO] {title[:50]}", file=file)
+            print(f"    → {src}", file=file)
 
     # Display sidebar embeds if they exist
     sidebar_embeds = data.get("sidebar_embeds", [])
     if sidebar_embeds:
-        print()
-        print(f"🎬 SIDEBAR VIMEO EMBEDS: {len(sidebar_embeds)}")
-        print("-" * 40)
+        print(file=file)
+        print(f"🎬 SIDEBAR VIMEO EMBEDS: {len(sidebar_embeds)}", file=file)
+        print("-" * 40, file=file)
         for i, (title, src) in enumerate(sidebar_embeds, len(embeds) + 1):
-            print(f"{i:2}.│[VIMEO] {title[:50]}")
-            print(f"   │→ {src}")
+            print(f"{i:2}.│[VIMEO] {title[:50]}", file=file)
+            print(f"   │→ {src}", file=file)
 
-    print()
-    print("=" * 60)
+    print(file=file)
+    print("=" * 60, file=file)
@@ -2,16 +2,26 @@
 Page extraction and analysis utilities for Linker CLI.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from pathlib import Path
 
-from utils.core import debug_print, normalize_url, check_status_code
+from utils.core import debug_print, normalize_url, check_status_code, http_session
 
 CACHE_DIR = Path("migration_cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
+# Upper bound on link status checks in flight at once, across all pages
+_STATUS_CHECK_WORKERS = 16
+
+# Shared pool for status checks, started on first use
+_status_check_pool = None
+_status_check_pool_lock = threading.Lock()
+
 
 def get_page_soup(url):
     """
@@ -30,7 +40,7 @@ def get_page_soup(url):
     try:
         url = normalize_url(url)
         debug_print(f"Normalized URL: {url}")
-        response = requests.get(url, timeout=5)
+        response = http_session().get(url, timeout=5)
         debug_print(
             f"HTTP GET request completed with status code: {response.status_code}"
         )
@@ -72,6 +82,38 @@ def extract_meta_robots(soup):
     return ""
 
 
+def _status_check_executor():
+    """Return the shared thread pool used to check link status codes.
+
+    The pool lives for the whole session, so its threads keep their
+    :func:`http_session` connections open between pages, and concurrent page
+    fetches share one limit on outstanding checks.
+    """
+    global _status_check_pool
+    with _status_check_pool_lock:
+        if _status_check_pool is None:
+            _status_check_pool = ThreadPoolExecutor(
+                max_workers=_STATUS_CHECK_WORKERS,
+                thread_name_prefix="status-check",
+            )
+        return _status_check_pool
+
+
+def check_status_codes(hrefs):
+    """Return the status code for each URL in ``hrefs``, in the same order.
+
+    Each distinct URL is checked once, and the checks run concurrently.
+    """
+    unique = list(dict.fromkeys(hrefs))
+    if len(unique) < 2:
+        statuses = {href: check_status_code(href) for href in unique}
+    else:
+        statuses = dict(
+            zip(unique, _status_check_executor().map(check_status_code, unique))
+        )
+    return [statuses[href] for href in hrefs]
+
+
 def extract_links_from_page(soup, response, selector="#main"):
     """Return the hyperlinks found within a page section.
 
@@ -94,14 +136,13 @@ def extract_links_from_page(soup, response, selector="#main"):
     debug_print(f"Using CSS selector: {selector}")
     container = soup.select_one(selector)
     if not container:
-        print(
+        debug_print(
             f"⚠️ Warning ⚠️: No element found matching selector '{selector}', falling back to entire page"
         )
         container = soup
     anchors = container.find_all("a", href=True)
     debug_print(f"Found {len(anchors)} anchor tags")
-    links = []
-    pdfs = []
+    found = []
     for a in anchors:
         if a.get("href") == "#" and a.has_attr("data-video"):
             debug_print("Skipping anchor tag treated as Vimeo embed")
@@ -112,7 +153,14 @@ def extract_links_from_page(soup, response, selector="#main"):
         debug_print(
             f"Processing link: {text[:50]}{'...' if len(text) > 50 else ''} -> {href}"
         )
-        status_code = check_status_code(href)
+        found.append((text, href))
+
+    # Check every link's status together rather than one request at a time
+    statuses = check_status_codes([href for _, href in found])
+
+    links = []
+    pdfs = []
+    for (text, href), status_code in zip(found, statuses):
         if href.lower().endswith(".pdf"):
             pdfs.append((text, href, status_code))
             debug_print(f"  -> Categorized as PDF")
@@ -132,7 +180,7 @@ def extract_embeds_from_page(soup, selector="#main"):
     embeds = []
     container = soup.select_one(selector)
     if not container:
-        print(
+        debug_print(
             f"Warning: No element found matching selector '{selector}', falling back to entire page for embeds"
         )
         container = soup
@@ -1,6 +1,7 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 
-from constants import DOMAIN_MAPPING, DOMAINS
+from constants import DOMAIN_MAPPING, NEW_SITECORE_ROOTS
 
 
 def format_hierarchy(root: str, segments: list) -> str:
@@ -12,12 +13,20 @@ def format_hierarchy(root: str, segments: list) -> str:
     return "\n".join(lines)
 
 
+def path_segments(path: str) -> list:
+    """Split a URL path into its non-empty segments."""
+    return [seg for seg in path.strip("/").split("/") if seg]
+
+
 def get_sitecore_root(existing_url: str) -> str:
     """
     Infer the Sitecore root folder name from the existing URL's hostname.
     """
-    parsed = urlparse(existing_url)
-    hostname = parsed.hostname or ""
+    return _sitecore_root_for_hostname(urlparse(existing_url).hostname or "")
+
+
+@lru_cache(maxsize=256)
+def _sitecore_root_for_hostname(hostname: str) -> str:
     return DOMAIN_MAPPING.get(hostname, hostname.split(".")[0])
 
 
@@ -32,41 +41,36 @@ def get_proposed_sitecore_root(existing_url: str) -> str:
     """Determine the Sitecore root folder for the redesigned site.
 
     The function checks the domain of ``existing_url`` against entries in
-    :data:`DOMAINS` and returns the ``root_for_new_sitecore`` value when
-    defined. If no mapping exists the current root is returned instead.
+    :data:`~constants.NEW_SITECORE_ROOTS` and returns the new root of the
+    first match. If no mapping exists the current root is returned instead.
     """
     from utils.core import debug_print
 
     proposed_root = next(
-        (
-            domain["root_for_new_sitecore"]
-            for domain in DOMAINS
-            if domain.get("url") in existing_url and domain.get("root_for_new_sitecore")
-        ),
-        None,
+        (root for url, root in NEW_SITECORE_ROOTS if url in existing_url), None
     )
 
     debug_print(f"Proposed root for {existing_url}: {proposed_root}")
     return proposed_root or get_sitecore_root(existing_url)
 
 
-def print_hierarchy(existing_url: str):
+def print_hierarchy(existing_url: str, file=None):
     """
     Print the Sitecore hierarchy for the given page's existing URL.
     """
     root = get_sitecore_root(existing_url)
     # split existing path
-    segments = [seg for seg in urlparse(existing_url).path.strip("/").split("/") if seg]
-    print("\nExisting directory hierarchy:")
-    print(format_hierarchy(root, segments))
+    segments = path_segments(urlparse(existing_url).path)
+    print("\nExisting directory hierarchy:", file=file)
+    print(format_hierarchy(root, segments), file=file)
 
 
-def print_proposed_hierarchy(existing_url: str, proposed_path: str):
+def print_proposed_hierarchy(existing_url: str, proposed_path: str, file=None):
     """
     Print the Sitecore hierarchy for a proposed URL path,
     using the department root inferred from existing URL.
     """
     root = get_sitecore_root(existing_url)
-    segments = [seg for seg in proposed_path.strip("/").split("/") if seg]
-    print("\nProposed directory hierarchy:")
-    print(format_hierarchy(root, segments))
+    segments = path_segments(proposed_path)
+    print("\nProposed directory hierarchy:", file=file)
+    print(format_hierarchy(root, segments), file=file)
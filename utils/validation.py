@@ -1,6 +1,6 @@
 from functools import wraps
 
-from constants import DOMAINS
+from constants import DOMAINS_BY_NAME
 
 
 def validate_load_args(args):
@@ -32,15 +32,7 @@ def validate_load_args(args):
     except (TypeError, ValueError):
         raise ValueError("Row number must be an integer") from None
 
-    domain = next(
-        (
-            d
-            for d in DOMAINS
-            if d.get("full_name", "").lower() == user_domain.lower()
-            or user_domain.lower() in [alias.lower() for alias in d.get("aliases", [])]
-        ),
-        None,
-    )
+    domain = DOMAINS_BY_NAME.get(user_domain.lower())
     if not domain:
         raise ValueError(f"Domain '{user_domain}' not found.")
 